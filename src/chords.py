@@ -1,14 +1,19 @@
 # new chord class with explicit factor recognition and compositional name generation/recognition
 
 # import notes
-from .notes import Note, NoteList, chromatic_scale, relative_minors, relative_majors, sharp_minor_tonics, sharp_major_tonics, flat_minor_tonics, flat_major_tonics
-from .intervals import Interval, IntervalList, P5
-from .util import log, precision_recall, rotate_list, check_all, auto_split, reverse_dict, unpack_and_reverse_dict
+from .notes import Note, OctaveNote, NoteList, note_at, chromatic_scale, relative_minors, relative_majors, sharp_minor_tonics, sharp_major_tonics, flat_minor_tonics, flat_major_tonics
+from .notes import sharp_major_tonic_positions, flat_major_tonic_positions, sharp_minor_tonic_positions, flat_minor_tonic_positions
+from .intervals import Interval, IntervalList, P5, interval_from_degree, interval_consonance
+from .util import log, rotate_list, check_all, auto_split, unpack_and_reverse_dict
 from . import parsing
 from . import qualities
 from .qualities import Quality, ChordQualifier, parse_chord_qualifiers
 
 from collections import defaultdict
+from heapq import heappush, heapreplace
+from types import MappingProxyType
+from functools import lru_cache
+from sys import intern
 
 from pdb import set_trace
 
@@ -25,15 +30,16 @@ class ChordFactors(dict):
             note these are not qualifiers that *should* be applied, but a history for this object.
             applying qualifiers must be done using the __add__ method, or the qualifier's .apply method"""
 
+    __slots__ = ('qualifiers',)
+
     def __init__(self, arg=None, qualifiers=None):
         """accepts any arg that would initialise a dict,
           and also allows a string of degree alterations (e.g. "1-♭3-♭♭5")
           or a list of such alterations (e.g. ["1", "♭3", "♭♭5"])
         also treats init by None (i.e. no args) as a major triad by default."""
 
-        # accept re-casting by dict comp:
-        if isinstance(arg, ChordFactors):
-            arg = {k:v for k,v in arg.items()}
+        # (re-casting from another ChordFactors object needs no special handling,
+        #  since dict init copies its items anyway)
 
         ### allow initialisation by string or list of chord degrees:
         if isinstance(arg, str):
@@ -78,16 +84,27 @@ class ChordFactors(dict):
         """the number of notes in the chord that this object represents"""
         return len(self)
 
+    @property
+    def degree_places(self):
+        """dict mapping each degree to its place among the sorted degrees,
+        i.e. the inversion that puts that degree in the bass"""
+        return {deg: x for x, deg in enumerate(sorted(self.keys()))}
+
     def to_intervals(self, as_dict=False):
         """translates these ChordFactors into an IntervalList
         or, if as_dict, into a factor_intervals dict mapping degrees to intervals"""
         if not as_dict:
-            return IntervalList([Interval.from_degree(d, offset=o) for d, o in self.items()]).sorted()
+            # (memoised on our items, since we are mutable and cannot be used as a cache key ourselves)
+            return IntervalList(_sorted_factor_intervals(tuple(self.items())))
         elif as_dict:
-            return {d:Interval.from_degree(d, offset=o) for d, o in self.items()}
+            return {d:interval_from_degree(d, o) for d, o in self.items()}
 
     def copy(self):
-        return ChordFactors({k:v for k,v in self.items()}, qualifiers=self.qualifiers)
+        # we are already a valid dict, so skip the input parsing in __init__:
+        new_factors = ChordFactors.__new__(ChordFactors)
+        dict.update(new_factors, self)
+        new_factors.qualifiers = list(self.qualifiers)
+        return new_factors
 
     def __add__(self, other):
         """modifies these factors by the alterations in a ChordQualifier,
@@ -98,18 +115,23 @@ class ChordFactors(dict):
             output_factors = other.apply(self)
             # output_factors.qualifiers.append(other)
         elif isinstance(other, (list, tuple)):
-            # apply a list of ChordQualifiers instead:
+            # apply a list of ChordQualifiers instead, successively modifying a single copy of self:
             output_factors = self.copy()
             for qual in other:
                 assert isinstance(qual, ChordQualifier), f"ChordFactor tried to be modified by an item in a list that was not a ChordQualifier but was: {type(qual)}"
-                output_factors = qual.apply(output_factors)
+                qual.apply(output_factors, inplace=True)
                 # output_factors.qualifiers.append(qual)
-        # ensure that we keep ourselves sorted:
         else:
             raise TypeError(f'Cannot add ChordFactors object to type: {type(other)}')
-        sorted_keys = sorted(list(output_factors.keys()))
-        # return output_factors
-        return ChordFactors({k: output_factors[k] for k in sorted_keys}, qualifiers = output_factors.qualifiers)
+        # ensure that we keep ourselves sorted, which only needs doing
+        # if a qualifier has added a new degree out of order:
+        degrees = list(output_factors.keys())
+        if degrees != sorted(degrees):
+            # output_factors is already a new copy, so we can re-order it in place rather than rebuild it:
+            sorted_items = sorted(output_factors.items())
+            output_factors.clear()
+            output_factors.update(sorted_items)
+        return output_factors
 
     def distance(self, other):
         # distance from other ChordFactors objects, to detect altered chords from their factors
@@ -135,10 +157,14 @@ class ChordFactors(dict):
         return self.distance(other)
 
     def __hash__(self):
-        return hash(tuple(self))
+        # hash degrees together with their offsets, consistent with dict equality
+        # (hashing the keys alone would make e.g. major and minor triads collide)
+        # as an unordered set of items, which needs no sorting:
+        return hash(frozenset(self.items()))
 
     def __str__(self):
-        factor_strs = [f'{parsing.offset_accidentals[v][0]}{d}' for d,v in self.items()]
+        acc_chars = parsing.offset_accidental_chars
+        factor_strs = [f'{acc_chars[v]}{d}' for d,v in self.items()]
         return f'¦ {", ".join(factor_strs)} ¦'
 
     def __repr__(self):
@@ -149,12 +175,110 @@ _major_triad = ChordFactors({1:0, 3:0, 5:0})
 # meaning: default intervals of 1st, 3rd, and 5th degrees
 # this _major_triad object is used for comparisons, but should never be modified
 
+@lru_cache(maxsize=4096)
+def _cached_factors_from_name(name):
+    """parses an AbstractChord name (without inversion) into ChordFactors.
+    the same few hundred names get parsed over and over (not least during the
+    chord-name lookup build at import), so results are memoised by name.
+    cached objects are shared and must not be modified: use factors_from_name instead"""
+    if name == '' or name in ((qualities.qualifier_aliases['maj']) + ['maj']):
+        return ChordFactors() # major triad by default
+    else:
+        qualifiers_from_name = parse_chord_qualifiers(name)
+        return ChordFactors() + qualifiers_from_name
+
+@lru_cache(maxsize=4096)
+def _sorted_factor_intervals(factor_items):
+    """returns the intervals from root of a tuple of ChordFactors items, i.e. (degree, offset) pairs,
+    as a tuple of (immutable) Intervals sorted by value"""
+    return tuple(sorted([interval_from_degree(d, o) for d, o in factor_items], key=lambda i: i.value))
+
+@lru_cache(maxsize=4096)
+def _consonance_from_values(values, tonic_weight):
+    """calculates the consonance property for a tuple of interval values (see AbstractChord.consonance),
+    which is memoised since chords with the same intervals keep being ranked against each other"""
+    # (same pairs as AbstractChord.pairwise_consonances, but looked up directly by interval value,
+    #  without building a dict of Interval pairs and difference Intervals first)
+    cons_list = []
+    for x, lower in enumerate(values):
+        for upper in values[x+1:]:
+            cons = interval_consonance(upper - lower)
+            if (tonic_weight != 1) and (lower == 0): # intervals from root are counted double
+                cons_list.extend([cons]*tonic_weight)
+            else:
+                cons_list.append(cons)
+    raw_cons = sum(cons_list) / len(cons_list)
+
+    # the raw consonance comes out as maximum=0.933 (i.e. 14/15) for the most consonant chord (the octave)
+    # by definition because of the constant 15 in the interval dissonance calculation, where
+    # perfect consonance (unison) has dissonance 0 and the octave has dissonance 1.
+
+    # chords cannot be on unison, so we'll set the ceiling to 1 instead of 0.9333.
+
+    # and the empirically observed minimum is just above 0.49 for the awful tritone plus minor ninth
+    # so we set that to be just around 0, and rescale the entire raw consonance range within those bounds:
+    max_cons = 14/15
+    min_cons = 0.49
+    return round((raw_cons - min_cons) / (max_cons - min_cons), 3)
+
+def factors_from_name(name):
+    """returns the ChordFactors of an AbstractChord name (without inversion),
+    as a fresh copy of the memoised parse result"""
+    return _cached_factors_from_name(name).copy()
+
+@lru_cache(maxsize=4096)
+def _cached_intervals_from_name(name):
+    """returns the sorted root intervals of an AbstractChord name (without inversion),
+    as a tuple of (immutable) Intervals, so that chords initialised by a name
+    we have seen before can skip building and sorting them all over again"""
+    return tuple(_cached_factors_from_name(name).to_intervals())
+
+def _inverted_interval_values(values, position):
+    """returns the values of IntervalList(values).invert(position) as a tuple,
+    for the inversion searches during chord init. (not memoised here, since
+    IntervalList.invert already memoises the inversion itself)"""
+    return tuple([i.value for i in IntervalList(list(values)).invert(position)])
+
+# ints that could be thirds or fifths, as the Intervals that we interpret them as
+# when initialising a chord by a list of ints:
+_likely_chord_intervals = {3: Interval(3, degree=3), 4: Interval(4, degree=3), # major/minor third
+                           6: Interval(6, degree=5), 7: Interval(7, degree=5), 8: Interval(8, degree=5)} # dim/perf/aug fifth
+
+# the string-parsing parts of Chord init by name are likewise memoised,
+# since they depend only on the name string and not on any object state:
+@lru_cache(maxsize=4096)
+def _parse_note_string(name):
+    """returns a tuple of the note names in name if it parses as a note-string like 'CEA',
+    or False otherwise"""
+    parse_result = parsing.parse_out_note_names(name, graceful_fail=True)
+    return tuple(parse_result) if parse_result is not False else False
+
+@lru_cache(maxsize=4096)
+def _split_inversion_name(name):
+    """splits an AbstractChord name like 'm7/2' into a (chord_name, inversion_str) tuple,
+    where inversion_str is None if the name does not contain a slash (or backslash)"""
+    if '/' in name or '\\' in name:
+        chord_name, inversion_str = name.replace('\\', '/').split('/')
+        return chord_name, inversion_str
+    else:
+        return name, None
+
+@lru_cache(maxsize=4096)
+def _split_root_name(name):
+    """splits a Chord name like 'F#sus4' into a (root_name, suffix) tuple"""
+    return parsing.note_split(name)
+
 ################################################################################
 
 class AbstractChord:
     """a hypothetical chord not built on any specific note but having all the qualifiers that a chord would,
     whose principal members are Intervals. see AbstractChord._parse_input for valid input schemas.
     an AbstractChord is fully identified by its Factors and its Inversion."""
+
+    # fixed attribute slots, since many thousands of these get made:
+    __slots__ = ('factors', 'root_intervals', 'intervals', 'inversion', 'factor_intervals', 'quality',
+                 '_interval_factors', '_factors_name_cache', '_consonance_cache')
+
     def __init__(self, name=None, factors=None, intervals=None, inversion=None, inversion_degree=None, qualifiers=None):
         """primary input arg must be one of the following mutually exclusive keywords, in order of resolution:
         1. 'name' arg as string denoting the name of an AbstractChord (like 'mmaj7'),
@@ -187,9 +311,8 @@ class AbstractChord:
 
         self.factors, self.root_intervals, self.inversion = self._parse_input(name, factors, intervals, inversion, inversion_degree, qualifiers)
 
-        # dict mapping chord factors to intervals from tonic (and vice versa):
+        # dict mapping chord factors to intervals from tonic (the reverse is built on demand):
         self.factor_intervals = {i.extended_degree: i for i in self.root_intervals}
-        self.interval_factors = reverse_dict(self.factor_intervals)
 
         if self.inversion != 0: # list of self.intervals is with respect to this chord's inversion
             self.intervals = self.root_intervals.invert(self.inversion)
@@ -203,6 +326,8 @@ class AbstractChord:
         """takes valid inputs to AbstractChord and parses them into factors, intervals and inversion.
         (see docstring for AbstractChord.__init__)"""
 
+        parsed_name = None # the name that factors were parsed from, if any
+
         if isinstance(name, list):
             # we've been fed a list, probably of integers or intervals:
             if (type(name) == IntervalList) or (type(name) == list and check_all(name, 'isinstance', (int, Interval))):
@@ -220,24 +345,19 @@ class AbstractChord:
         if name is not None:
             assert factors is None and intervals is None
             # check for inversion by slashes: (or sometimes backslashes)
-            if '/' in name or '\\' in name:
+            name, inversion_str = _split_inversion_name(name)
+            if inversion_str is not None:
                 assert inversion is None and inversion_degree is None, 'Parsed slash chord as denoting inversion, but received mutually exclusive inversion arg'
                 # parse inversion from name
-                name = name.replace('\\', '/')
-                name, inversion_str = name.split('/')
-
                 if inversion_str.isnumeric():
                     inversion = int(inversion_str)
                 else:
                     assert _allow_note_name, f'String inversions only allowed for non-AbstractChords'
                     inversion = inversion_str
 
-            # detect if name refers to a major chord:
-            if name == '' or name in ((qualities.qualifier_aliases['maj']) + ['maj']):
-                factors = ChordFactors() # major triad by default
-            else:
-                qualifiers_from_name = parse_chord_qualifiers(name)
-                factors = ChordFactors() + qualifiers_from_name
+            # parse name into factors (major triad if the name refers to a major chord):
+            factors = factors_from_name(name)
+            parsed_name = name
         elif factors is not None:
             assert name is None and intervals is None
             # do nothing! factors are already defined, just pass to next block
@@ -247,42 +367,35 @@ class AbstractChord:
 
             # if it is a list of ints, catch common thirds/fifths:
             if isinstance(intervals, (tuple, list)) and check_all(intervals, 'isinstance', int):
-                sanitised_intervals = []
-                for i in intervals:
-                    if i in {3,4}: # could this be a major/minor third?
-                        sanitised_intervals.append(Interval(i, degree=3))
-                    elif i in {6,7,8}: # could this be a dim/perf/aug fifth?
-                        sanitised_intervals.append(Interval(i, degree=5))
-                    else:
-                        sanitised_intervals.append(i)
-                intervals = sanitised_intervals
+                intervals = [_likely_chord_intervals.get(i, i) for i in intervals]
 
             # cast to IntervalList object, pad to canonical chord intervals form with left bass root but not upper octave root
             intervals = IntervalList(intervals).pad(left=True, right=False)
             assert len(intervals) == len(set(intervals)), f'Interval list supplied to AbstractChord init contains repeated intervals: {intervals}'
 
             # check if this is an inversion of some common chord:
-            if intervals in intervals_to_chord_names:
+            supplied_interval_chord_name = chord_name_from_intervals(intervals)
+            if supplied_interval_chord_name is not None:
                 # (we'll use the inversion only if it's less rare than the root intervals)
-                supplied_interval_chord_name = intervals_to_chord_names[intervals]
                 supplied_rarity = chord_name_rarities[supplied_interval_chord_name]
             else:
                 supplied_rarity = 10 # max possible
 
             # search for possible inversions if this is not already one,
             # and adopt the most common, if it's more common than what we've been given:
-            if inversion is None and inversion_degree is None:
-                possible_inversions = AbstractChord.inversions_from_intervals(intervals)
-                if len(possible_inversions) > 0 and possible_inversions[0].rarity < supplied_rarity:
+            # (no inversion can be more common than a chord of rarity 0, so we don't search in that case)
+            if inversion is None and inversion_degree is None and supplied_rarity > 0:
+                possible_inversions = AbstractChord._inversion_names_from_intervals(intervals)
+                if len(possible_inversions) > 0 and possible_inversions[0][0] < supplied_rarity:
                     # adopt the inverted chord's root intervals and inversion instead
-                    intervals = possible_inversions[0].root_intervals
-                    inversion = possible_inversions[0].inversion
+                    _, inverted_chord_name, inversion = possible_inversions[0]
+                    intervals = IntervalList(_cached_intervals_from_name(inverted_chord_name))
                     # and one last change (bit of a kludge): if this is a Chord, intercept and change the root:
                     if isinstance(self, Chord):
                         self.root -= intervals[inversion]
                 else:
                     # we've failed to find an inversion, so just use the intervals and root as they are
-                    if intervals not in intervals_to_chord_names:
+                    if supplied_interval_chord_name is None:
                         log(f'Failed to find a matching chord or inversion for intervals: {intervals}')
 
             # build factors by looping through intervals:
@@ -312,18 +425,24 @@ class AbstractChord:
         if intervals is None: # i.e. if we have defined factors from name or factor kwarg
             # in this case we trust them and do not insist that this is an inversion
             # i.e. we keep 6(no5) instead of casting to m/2
-            intervals = []
-            for deg, offset in factors.items():
-                # note that interval list always includes Unison as root
-                intervals.append(Interval.from_degree(deg, offset=offset))
-            intervals = IntervalList(intervals)
+            # (note that interval list always includes Unison as root)
+            # (and is already sorted by value, so needs no further sorting below)
+            if parsed_name is not None and qualifiers is None:
+                # factors are exactly those of this name, so we can use its memoised intervals:
+                intervals = IntervalList(_cached_intervals_from_name(parsed_name))
+            else:
+                intervals = factors.to_intervals()
+            intervals_already_sorted = True
+        else:
+            # intervals given directly are usually sorted already too (padding requires it),
+            # which is cheaper to check than to sort them anyway:
+            intervals_already_sorted = intervals.is_sorted()
 
         if inversion_degree is not None:
             # which Xth inversion is this, from the inversion degree:
-            for x, deg in enumerate(sorted(factors.keys())):
-                if inversion_degree == deg:
-                    inversion = x
-                    break
+            degree_places = factors.degree_places
+            if inversion_degree in degree_places:
+                inversion = degree_places[inversion_degree]
 
         if (inversion is not None) and (inversion != 0):
             if isinstance(inversion, int):
@@ -339,7 +458,20 @@ class AbstractChord:
         else:
             inversion = 0 # 0th inversion means no inversion at all
 
-        return factors, intervals.sorted(), inversion
+        if not intervals_already_sorted:
+            intervals = intervals.sorted()
+
+        return factors, intervals, inversion
+
+    @property
+    def interval_factors(self):
+        """dict mapping intervals from tonic back to the chord factors they belong to
+        (built on first access and cached thereafter)"""
+        try:
+            return self._interval_factors
+        except AttributeError:
+            self._interval_factors = {i: d for d, i in self.factor_intervals.items()}
+            return self._interval_factors
 
     def _determine_quality(self):
         # quality of a chord is the quality of its third:
@@ -375,30 +507,49 @@ class AbstractChord:
     def suffix(self):
         return self.get_suffix(inversion=True)
 
+    def _factors_name(self):
+        """the name that this chord's factors are registered under in factors_to_chord_names, or None.
+        this gets looked up every time a chord is named, so we cache it against the factors
+        object itself (which is replaced, not mutated, if a Chord gets re-initialised)"""
+        try:
+            cached_factors, name = self._factors_name_cache
+            if cached_factors is self.factors:
+                return name
+        except AttributeError:
+            pass
+        name = factors_to_chord_names.get(self.factors)
+        self._factors_name_cache = (self.factors, name)
+        return name
+
     def get_suffix(self, inversion=True):
         """dynamically determine chord suffix from factors and inversion"""
         inv_string = self._inv_string if inversion else ''
-        if self.factors in factors_to_chord_names:
-            return factors_to_chord_names[self.factors] + inv_string
-        elif self.root_intervals in intervals_to_chord_names:
-            suf = intervals_to_chord_names[self.root_intervals] + inv_string
+        factors_name = self._factors_name()
+        if factors_name is not None:
+            return factors_name + inv_string
+
+        # otherwise, fall back on looking the chord up by its intervals:
+        root_intervals_name = chord_name_from_intervals(self.root_intervals)
+        if root_intervals_name is not None:
+            suf = root_intervals_name + inv_string
             log(f' ++ Could not find chord by factors ({self.factors}), but found it by root intervals ({self.root_intervals}): {suf}')
             return suf
-        elif self.intervals in intervals_to_chord_names:
-            # set_trace(context=30) # can't remember what is going on here
-            print(f' ++++ Could not find chord by factors ({self.factors}), but found it by inverted intervals: {self.intervals}')
-            import pdb; pdb.set_trace() # in case this ever comes up
-            return intervals_to_chord_names[self.intervals] + f' (inverted from {self.root})'
+        inverted_intervals_name = chord_name_from_intervals(self.intervals)
+        if inverted_intervals_name is not None:
+            log(f' ++++ Could not find chord by factors ({self.factors}), but found it by inverted intervals: {self.intervals}')
+            return inverted_intervals_name + f' (inverted from {self.root})'
         elif 5 not in self.factors:
             # try adding a 5 to see if this is a (no5) chord
             intervals_with_5 = IntervalList(sorted(list(self.root_intervals) + [P5]))
-            if intervals_with_5 in intervals_to_chord_names:
-                return intervals_to_chord_names[intervals_with_5] + '(no5)' + inv_string
+            name_with_5 = chord_name_from_intervals(intervals_with_5)
+            if name_with_5 is not None:
+                return name_with_5 + '(no5)' + inv_string
             # try the same for this chord's inversions? (this gets messy very fast)
 
         # try flattening intervals and seeing if that produces a chord: (i.e. parsing CGE as CEG)
-        if self.intervals.flatten() in intervals_to_chord_names:
-            return intervals_to_chord_names[self.intervals.flatten()]
+        flattened_name = chord_name_from_intervals(self.intervals.flatten())
+        if flattened_name is not None:
+            return flattened_name
         elif self.factors == _major_triad:
             return ''
         elif self.assigned_name is not None:
@@ -410,7 +561,7 @@ class AbstractChord:
     @property
     def rarity(self):
         """an integer denoting how rarely this chord is used in practice"""
-        return chord_name_rarities[factors_to_chord_names[self.factors]]
+        return chord_name_rarities[self._factors_name()]
 
     @property
     def likelihood(self):
@@ -451,38 +602,42 @@ class AbstractChord:
     @property
     def consonance(self, tonic_weight=2):
         """the weighted mean of pairwise interval consonances"""
-        cons_list = []
-        for pair, cons in self.pairwise_consonances.items():
-            if (tonic_weight != 1) and (pair[0].value == 0): # intervals from root are counted double
-                cons_list.extend([cons]*tonic_weight)
-            else:
-                cons_list.append(cons)
-        raw_cons = sum(cons_list) / len(cons_list)
-
-        # the raw consonance comes out as maximum=0.933 (i.e. 14/15) for the most consonant chord (the octave)
-        # by definition because of the constant 15 in the interval dissonance calculation, where
-        # perfect consonance (unison) has dissonance 0 and the octave has dissonance 1.
-
-        # chords cannot be on unison, so we'll set the ceiling to 1 instead of 0.9333.
-
-        # and the empirically observed minimum is just above 0.49 for the awful tritone plus minor ninth
-        # so we set that to be just around 0, and rescale the entire raw consonance range within those bounds:
-        max_cons = 14/15
-        min_cons = 0.49
-        rescaled_cons = (raw_cons - min_cons) / (max_cons - min_cons)
-        return round(rescaled_cons, 3)
+        # this gets queried repeatedly when ranking chords, so we cache it
+        # against the intervals object it was calculated from (as in _factors_name):
+        try:
+            cached_intervals, cached_cons = self._consonance_cache
+            if cached_intervals is self.intervals:
+                return cached_cons
+        except AttributeError:
+            pass
+
+        rescaled_cons = _consonance_from_values(tuple([i.value for i in self.intervals]), tonic_weight)
+        self._consonance_cache = (self.intervals, rescaled_cons)
+        return rescaled_cons
 
     @staticmethod
     def inversions_from_intervals(intervals):
         """searches an interval list's inversions for possible matching chords
-        and returns as a dict keying candidate inverted AbstractChords to their rarities"""
+        and returns a list of candidate inverted AbstractChords, sorted by rarity"""
+        return [AbstractChord(that_chord_name, inversion=inversion_place)
+                for _, that_chord_name, inversion_place in AbstractChord._inversion_names_from_intervals(intervals)]
+
+    @staticmethod
+    def _inversion_names_from_intervals(intervals):
+        """as inversions_from_intervals, but without initialising any chords:
+        returns a list of (rarity, chord_name, inversion_place) tuples, sorted by rarity"""
         candidates = []
-        for inversion_place in range(1, len(intervals)):
-            inverted_intervals = intervals.invert(-inversion_place)
-            if inverted_intervals in intervals_to_chord_names:
-                that_chord_name = intervals_to_chord_names[inverted_intervals]
-                candidates.append(AbstractChord(that_chord_name, inversion=inversion_place))
-        candidates.sort(key = lambda x: x.rarity)
+        values = tuple([i.value for i in intervals])
+        for inversion_place in range(1, len(values)):
+            that_chord_name = interval_values_to_chord_names.get(_inverted_interval_values(values, -inversion_place))
+            if that_chord_name is not None:
+                # a match with no more factors than this inversion place (e.g. when the supplied intervals contain
+                # an octave, which the inversion collapses) cannot be inverted that far, so reject it
+                # just as initialising that inverted chord would:
+                num_factors = len(_cached_factors_from_name(that_chord_name))
+                assert 0 < inversion_place <= (num_factors-1), f'{inversion_place} is an invalid inversion number for chord with {num_factors} factors'
+                candidates.append((chord_name_rarities[that_chord_name], that_chord_name, inversion_place))
+        candidates.sort(key = lambda x: x[0])
         return candidates
 
     @property
@@ -609,7 +764,8 @@ class AbstractChord:
     def __eq__(self, other):
         """AbstractChords are equal to others on the basis of their factors and inversion"""
         if type(other) == AbstractChord:
-            return (self.factors == other.factors) and (self.inversion == other.inversion)
+            # (identical objects are trivially equal, otherwise compare the cheap int inversion before the factors dict)
+            return (self is other) or ((self.inversion == other.inversion) and (self.factors == other.factors))
         else:
             raise TypeError(f'AbstractChords can only be compared to other AbstractChords')
 
@@ -618,12 +774,22 @@ class AbstractChord:
 
 ################################################################################
 
+# combining accent marks used by Chord.__repr__ to show which octave (relative to the bass) a note is in,
+# keyed by octave offset: these are lower diaresis, lower dot, (none), upper dot and upper diaresis
+octave_accent_marks = {-2: '\u0324', -1: '\u0323', 0: '', 1: '\u0307', 2: '\u0308'}
+# translation table that strips those marks from a string, so we can count them in one pass:
+_strip_accent_marks = str.maketrans({mark: None for mark in octave_accent_marks.values() if mark})
+
 class Chord(AbstractChord):
     """a Chord built on a note of the chromatic scale, but in no particular octave.
             shares all of the attributes/methods of AbstractChord,
             but additionally has a root and a note list. (and a sharp/flat preference)
             if inverted, also stores bass note, and note list in inverted position.
     """
+
+    __slots__ = ('root', 'factor_notes', 'root_notes', 'notes', 'inversion_degree', 'bass', 'prefer_sharps',
+                 '_note_factors', '_position_mask_cache')
+
     def __init__(self, name=None,
                        root=None, factors=None, intervals=None, notes=None,
                        inversion=None, inversion_degree=None, bass=None,
@@ -678,7 +844,7 @@ class Chord(AbstractChord):
             assert name is None # but allow inversions
             note_list = NoteList(notes)
             # recover intervals and root, and continue to init as normal:
-            intervals = NoteList(notes).ascending_intervals()
+            intervals = note_list.ascending_intervals()
             root = note_list[0]
 
         # if name is a proper chord name like 'C' or 'Amaj' or 'D#sus2', separate it out into root and suffix components:
@@ -698,10 +864,12 @@ class Chord(AbstractChord):
 
         # mapping of chord factors to intervals from tonic:
         self.factor_intervals = {i.extended_degree: i for i in self.root_intervals}
-        self.interval_factors = reverse_dict(self.factor_intervals)
-        # mapping of chord factors to notes:
-        self.factor_notes = {degree: (self.root + i) for degree, i in self.factor_intervals.items()}
-        self.note_factors = reverse_dict(self.factor_notes)
+        # and mapping of chord factors to notes (the reverses of both are built on demand):
+        self.factor_notes = {}
+        root_position, root_sharps = self.root.position, self.root.prefer_sharps
+        for degree, i in self.factor_intervals.items():
+            # (same as self.root + i, but doing the pitch class arithmetic here directly)
+            self.factor_notes[degree] = note_at((root_position + i.value) % 12, root_sharps)
 
         # list of notes inside this chord, in root position:
         self.root_notes = NoteList(self.factor_notes.values())
@@ -711,12 +879,27 @@ class Chord(AbstractChord):
 
         self.inversion, self.inversion_degree, self.bass = inv_params
 
-        # quality of a chord is the quality of its third:
-        self.quality = qualities.Perfect if 3 not in self.factors else self.factor_intervals[3].quality
+        self.quality = self._determine_quality()
 
         # set sharp preference based on root note:
         self._set_sharp_preference(prefer_sharps) ### TBI: move this up and make it affect root_notes etc. as well?
 
+    @property
+    def note_factors(self):
+        """dict mapping notes in this chord back to the chord factors they belong to
+        (built on first access and cached thereafter)"""
+        try:
+            return self._note_factors
+        except AttributeError:
+            self._note_factors = {n: d for d, n in self.factor_notes.items()}
+            return self._note_factors
+
+    def _determine_quality(self):
+        """overrides AbstractChord._determine_quality: the quality of a Chord is simply the
+        quality of its third (or Perfect if it has none), without considering the fifth,
+        which is what sharp preference detection and chord matching on Chords rely on"""
+        return qualities.Perfect if 3 not in self.factors else self.factor_intervals[3].quality
+
     @staticmethod
     def _reparse_args(name, root, factors, intervals, notes):
         """re-parse args to detect if 'name' is a list of notes, a list of intervals, or a dict of chordfactors,
@@ -738,9 +921,9 @@ class Chord(AbstractChord):
             name = None
         elif isinstance(name, str):
             ### here we must distinguish if name is a potential note_string, of the kind we can parse out
-            parse_result = parsing.parse_out_note_names(name, graceful_fail=True)
+            parse_result = _parse_note_string(name)
             if parse_result is not False and len(parse_result) >= 2: # we don't allow note_strings for chord init unless they contain 2 or more notes
-                notes = parse_result
+                notes = list(parse_result)
                 name = None
             else:
                 # this is not a note_string, so just return the args as they came
@@ -753,7 +936,7 @@ class Chord(AbstractChord):
         """takes the class's name and root args, and determines which has been given.
         returns root as a Note object, and chord suffix as string or None"""
         if name is not None:
-            root_name, suffix = parsing.note_split(name)
+            root_name, suffix = _split_root_name(name)
             root = Note(root_name)
         elif root is not None:
             root = Note(root)
@@ -837,20 +1020,19 @@ class Chord(AbstractChord):
                     log('     Throwing bass note on top of this chord and calling it an inversion')
                     new_intervals = IntervalList(list(self.root_intervals) + [bass_distance_from_root])
                 assert new_intervals == new_intervals.sorted()
-                print(f'    New intervals: {new_intervals}')
+                log(f'    New intervals: {new_intervals}')
                 # recursively re-initialise:
                 self.__init__(intervals=new_intervals, root=self.root, bass=bass)
                 return self._parse_inversion(bass.name)
 
             ####################################################################
 
-            inversion_degree = [k for k,v in self.factor_notes.items() if v == bass][0]
+            # the bass's degree is the first (lowest) factor on that note: not note_factors[bass],
+            # which keeps the last one when two factors share a note (e.g. the 2 and 9 of a 9sus2)
+            bass_position = bass.position
+            inversion_degree = next(d for d, n in self.factor_notes.items() if n.position == bass_position)
             # get inversion from inversion_degree:
-            for x, deg in enumerate(sorted(self.factors.keys())):
-                if inversion_degree == deg:
-                    inversion = x
-                    break
-            assert isinstance(inversion, int), f"Invalid inversion degree for this chord: {inversion}"
+            inversion = self.factors.degree_places[inversion_degree]
 
         # infer inverted note order by finding the bass's place in our root_notes notelist:
         # bass_place = [i for i, n in enumerate(self.root_notes) if n == bass][0]
@@ -874,17 +1056,18 @@ class Chord(AbstractChord):
     def _detect_sharp_preference(self, default=False): #tonic, quality='major', default=False):
         """detect if a chord should prefer sharp or flat labelling
         depending on its tonic and quality"""
+        root_pos = self.root.position
         if self.quality.major:
-            if self.root in sharp_major_tonics:
+            if root_pos in sharp_major_tonic_positions:
                 return True
-            elif self.root in flat_major_tonics:
+            elif root_pos in flat_major_tonic_positions:
                 return False
             else:
                 return default
         elif self.quality.minor:
-            if self.root in sharp_minor_tonics:
+            if root_pos in sharp_minor_tonic_positions:
                 return True
-            elif self.root in flat_minor_tonics:
+            elif root_pos in flat_minor_tonic_positions:
                 return False
             else:
                 return default
@@ -900,20 +1083,31 @@ class Chord(AbstractChord):
             prefer_sharps = self._detect_sharp_preference()
 
         self.prefer_sharps = prefer_sharps
-        self.root._set_sharp_preference(prefer_sharps)
-        self.bass._set_sharp_preference(prefer_sharps)
-        for n in self.notes:
-            n._set_sharp_preference(prefer_sharps)
+        # root and bass are usually the very same objects as members of self.notes,
+        # so update each distinct note just once, and only if its preference differs:
+        distinct_notes = {id(n): n for n in (self.root, self.bass, *self.notes)}
+        for n in distinct_notes.values():
+            if n.prefer_sharps != prefer_sharps:
+                n._set_sharp_preference(prefer_sharps)
 
     @property
     def sharp_notes(self):
         """returns notes inside self, all with sharp preference"""
-        return NoteList([Note(n.chroma, prefer_sharps=True) for n in self.notes])
+        return self._notes_with_preference(prefer_sharps=True)
 
     @property
     def flat_notes(self):
         """returns notes inside self, all with flat preference"""
-        return NoteList([Note(n.chroma, prefer_sharps=False) for n in self.notes])
+        return self._notes_with_preference(prefer_sharps=False)
+
+    def _notes_with_preference(self, prefer_sharps):
+        """returns a new NoteList of new Notes that correspond to the notes in self,
+        all with the desired sharp preference"""
+        note_list = NoteList(self.notes)
+        # (NoteList re-casts its items to Notes of default preference, so we set it afterwards)
+        for n in note_list:
+            n._set_sharp_preference(prefer_sharps)
+        return note_list
 
     @property
     def name(self):
@@ -924,10 +1118,6 @@ class Chord(AbstractChord):
         # identical to self.name in the case of Chord class
         return f'{self.root.name}{self.suffix}'
 
-    def __hash__(self):
-        # chords hash based on their notes and intervals
-        return hash((self.notes, self.intervals))
-
     @property
     def _marker(self):
         """unicode character marker identifying this class"""
@@ -946,17 +1136,14 @@ class Chord(AbstractChord):
         notes_str = [] # notes are annotated with accent marks depending on which octave they're in (with respect to root)
         for i, n in zip(self.intervals, self.notes):
             assert (self.bass + i) == n, f'bass ({self.bass}) + interval ({i}) should be {n}, but is {self.bass + i}'
-            nl, na = str(n)[:2], str(n)[2:] # note letter and accidental (so we can put the dot over the letter)
-            if i < -12:
-                notes_str.append(f'{nl}\u0324{na}') # lower diaresis
-            elif i < 0:
-                notes_str.append(f'{nl}\u0323{na}') # lower dot
-            elif i < 12:
-                notes_str.append(str(n))
-            elif i < 24:
-                notes_str.append(f'{nl}\u0307{na}') # upper dot
+            n_str = str(n)
+            # look up the accent for this note's octave offset (clamped to two octaves either way):
+            accent = octave_accent_marks[max(-2, min(2, i.value // 12))]
+            if accent:
+                # note letter and accidental, so we can put the accent over the letter:
+                notes_str.append(f'{n_str[:2]}{accent}{n_str[2:]}')
             else:
-                notes_str.append(f'{nl}\u0308{na}') # upper diaresis
+                notes_str.append(n_str)
         notes_str = ', '.join(notes_str)
 
         return f'{str(self)}  {lb}{notes_str}{rb}'
@@ -973,19 +1160,26 @@ class Chord(AbstractChord):
             return item in self.factors
         elif isinstance(item, (Note, str)):
             n = Note(item)
-            return n in self.notes
+            # notes are equal by position, so test the note's bit rather than scanning self.notes:
+            return bool((self._position_mask >> n.position) & 1)
         else:
             raise TypeError(f'Chord object cannot contain items of type: {type(item)}')
 
     def __eq__(self, other):
         """Chords are equal to others on the basis of their root, factors and inversion"""
         if type(other) == Chord:
-            return (self.factors == other.factors) and (self.inversion == other.inversion) and (self.root == other.root)
+            # (roots are always Notes, so we compare their positions directly
+            #  rather than going through Note.__eq__ and its type checks)
+            if self is other:
+                return True
+            return (self.root.position == other.root.position) and (self.inversion == other.inversion) and (self.factors == other.factors)
         else:
             raise TypeError(f'Chords can only be compared to other Chords')
 
     def __hash__(self):
-        return hash(((tuple(self.factors.items())), self.inversion, self.root))
+        # (not cached on the instance: factors is a mutable dict that qualifiers can edit in place,
+        #  and this is only a short tuple of factor items, the inversion and the root's position)
+        return hash(((tuple(self.factors.items())), self.inversion, self.root.position))
 
     # enharmonic equality:
     def enharmonic_to(self, other):
@@ -993,14 +1187,11 @@ class Chord(AbstractChord):
         i.e. whether they contain the exact same notes (but not necessarily in the same order),
         or between Chord and AbstractChord, i.e. do they contain the same intervals"""
         if isinstance(other, Chord):
-            matching_notes = 0
-            for note in self.notes:
-                if note in other.notes:
-                    matching_notes += 1
-            if matching_notes == len(self.notes) and len(self.notes) == len(other.notes):
-                return True
-            else:
+            # every note in self must also be in other, which we check with
+            # bitmasks over note positions rather than pairwise note comparisons:
+            if len(self.notes) != len(other.notes):
                 return False
+            return (self._position_mask & ~other._position_mask) == 0
         elif isinstance(other, AbstractChord):
             return self.intervals == other.intervals
         else:
@@ -1010,6 +1201,19 @@ class Chord(AbstractChord):
     def __and__(self, other):
         return self.enharmonic_to(other)
 
+    @property
+    def _position_mask(self):
+        """12-bit integer with one bit set for the position of each note in this chord
+        (built on first access and cached thereafter, since a chord's notes never change)"""
+        try:
+            return self._position_mask_cache
+        except AttributeError:
+            mask = 0
+            for n in self.notes:
+                mask |= 1 << n.position
+            self._position_mask_cache = mask
+            return mask
+
 
     ### relative majors/minors are not very well-defined for chords (as opposed to keys), but we can have them anyway:
     @property
@@ -1017,7 +1221,7 @@ class Chord(AbstractChord):
         # assert not self.minor, f'{self} is already minor, and therefore has no relative minor'
         assert self.quality.major, f'{self} is not major, and therefore has no relative minor'
         rel_root = relative_minors[self.root.name]
-        new_factors = ChordFactors(self.factors)
+        new_factors = self.factors.copy()
         new_factors[3] -= 1 # flatten third
         if 5 in self.factors: # if fifth is aug/dim, make it dim/aug
             new_factors[5] = -self.factors[5]
@@ -1028,7 +1232,7 @@ class Chord(AbstractChord):
         # assert not self.major, f'{self} is already major, and therefore has no relative major'
         assert self.quality.minor, f'{self} is not minor, and therefore has no relative major'
         rel_root = relative_majors[self.root.name]
-        new_factors = ChordFactors(self.factors)
+        new_factors = self.factors.copy()
         new_factors[3] += 1 # raise third
         if 5 in self.factors: # if fifth is aug/dim, make it dim/aug
             new_factors[5] = -self.factors[5]
@@ -1047,7 +1251,7 @@ class Chord(AbstractChord):
     def parallel_minor(self):
         if not self.quality.major_ish:
             raise Exception(f'{self} is not major, and therefore has no parallel minor')
-        new_factors = ChordFactors(self.factors)
+        new_factors = self.factors.copy()
         new_factors[3] -= 1 # flatten third
         if 5 in self.factors: # if fifth is aug/dim, make it dim/aug
             new_factors[5] = -self.factors[5]
@@ -1057,7 +1261,7 @@ class Chord(AbstractChord):
     def parallel_major(self):
         if not self.quality.minor_ish:
             raise Exception(f'{self} is not minor, and therefore has no parallel major')
-        new_factors = ChordFactors(self.factors)
+        new_factors = self.factors.copy()
         new_factors[3] += 1 # raise third
         if 5 in self.factors: # if fifth is aug/dim, make it dim/aug
             new_factors[5] = -self.factors[5]
@@ -1167,93 +1371,179 @@ ordered_modifier_names = ['sus4', 'sus2', 'add9', 'add11', 'add13']
 modifier_names_by_rarity = {1: ['sus4', 'sus2'], 2: ['add9'], 3: ['add11'], 4: ['add13']}
 
 # these modifiers make a chord's quality indeterminate, so we don't apply them to chords that have had the minor qualifier already applied
-ind_modifiers = {'sus4', 'sus2', '5'}
+ind_modifiers = frozenset({'sus4', 'sus2', '5'})
 # these chord names cannot be modified:
-unmodifiable_chords = {'', '5', '(no5)', 'add4', 'add9', 'add11', 'add13'}
+unmodifiable_chords = frozenset({'', '5', '(no5)', 'add4', 'add9', 'add11', 'add13'})
 # '' because most ordinary chord types imply modification from major, i.e. 'sus4' implies ['' + 'sus4']
 # '5' and '(no5)' because they both imply simple removals of triad degrees, and are best handled by fuzzy matching
 # and add4/add9/add11 chords because they are themselves modifiers; they combine oddly with sus2/sus4, and must be done strictly in sus/add order
 
 # now we'll loop over those chords and build a dict mapping intervals/factors to their names:
-factors_to_chord_names, intervals_to_chord_names = {}, {}
-# (while adding chord modifications/alterations as well)
-
-chord_name_rarities = unpack_and_reverse_dict(chord_names_by_rarity)
-modifier_name_rarities = unpack_and_reverse_dict(modifier_names_by_rarity)
-
-new_rarities = {i: [] for i in range(8)}
-for rarity, chord_names in chord_names_by_rarity.items():
-    log(f'Handling base chords for rarity={rarity}, chords={chord_names}')
-
-    for chord_name in chord_names:
-        base_chord = AbstractChord(chord_name)
-        log(f'Handling base chord: r:{rarity} {chord_name}')
-
-        if base_chord.factors in factors_to_chord_names or base_chord.intervals in intervals_to_chord_names:
-            log(f'  {chord_name} clash with {intervals_to_chord_names[base_chord.intervals]}')
-        else:
-            factors_to_chord_names[base_chord.factors] = chord_name
-            intervals_to_chord_names[base_chord.intervals] = chord_name
-
-# handle the modifiers of base chords in a new loop:
-for rarity, chord_names in chord_names_by_rarity.items():
-    log(f'Handling modifiers for rarity={rarity}, chords={chord_names}')
-
-    for chord_name in chord_names:
-        if chord_name not in unmodifiable_chords:
-            base_chord = AbstractChord(chord_name)
-            # now: add chord modifications to each base chord as well, increasing rarity accordingly
-            for mod_name in ordered_modifier_names:
-                modifier = qualities.chord_modifiers[mod_name] # fetch ChordQualifier object by name
-                # add a modification if it does not already exist by name and is valid on this base chord:
-                if modifier.valid_on(base_chord.factors):
-                    # (we check if base chord is major because the modifiers on their own apply to major chords,
-                    #  i.e. the chord 'sus2' implies ['' + 'sus2'])
-                    if not ((modifier in ind_modifiers) and (base_chord.quality.minor)):
-                        altered_name = chord_name + mod_name
-
-                        altered_factors = base_chord.factors + modifier
-                        altered_intervals = altered_factors.to_intervals()
-                        # avoid double counting: e.g. this ensures that '9sus4' and 'm9sus4' are treated as one chord, '9sus4', despite both being a valid chord init
-                        if altered_factors not in factors_to_chord_names and altered_intervals not in intervals_to_chord_names:
-                            factors_to_chord_names[altered_factors] = altered_name
-                            intervals_to_chord_names[altered_intervals] = altered_name
-
-                            # figure out the rarity of this modification and add it to the rarity dict:
-                            mod_rarity = modifier_name_rarities[mod_name]
-                            altered_rarity = chord_name_rarities[chord_name] + mod_rarity
-                            new_rarities[altered_rarity].append(altered_name)
-
-                            # finally: do the same again, but one level deeper!
-                            for mod_name2 in ordered_modifier_names:
-                                modifier2 = qualities.chord_modifiers[mod_name] # fetch ChordQualifier object by name
-                                # do not apply the same modifier twice, and do so only if valid:
-                                if (modifier2 is not modifier) and modifier2.valid_on(altered_factors):
-                                    if not ((modifier2 in ind_modifiers) and (base_chord.quality.minor)):
-                                        # and, special case, not if (no5) is the first mod, since it always comes last:
-                                        if mod_name != '(no5)':
-                                            altered2_name = altered_name + mod2_name
-
-                                            altered2_factors = altered_factors + modifier2
-                                            altered2_intervals = altered2_factors.to_intervals()
-                                            # avoid the lower triangular: (e.g. m(no5)add9 vs madd9(no5))
-                                            if altered2_factors not in factors_to_chord_names and altered2_intervals not in intervals_to_chord_names:
-                                                factors_to_chord_names[altered2_factors] = altered2_name
-                                                intervals_to_chord_names[altered2_intervals] = altered2_name
-
-                                                # these are all rarity 7, the 'legendary chords'
-                                                new_rarities[7].append(altered2_name)
-
-# update chord_names_by_rarity with new rarities:
+def _build_chord_name_lookups(chord_names_by_rarity):
+    """loops over the base chords in chord_names_by_rarity, as well as their modifications,
+    and returns a tuple of: (factors_to_chord_names, intervals_to_chord_names, new_rarities,
+                             chord_names_to_factors, chord_names_to_intervals, chord_name_rarities)
+    where new_rarities is a dict mapping rarities to the names of the modified chords,
+    and the last three are the reverse lookups of the others, filled in as we go.
+    all of the import-time chord building happens here, in one place, with local names
+    instead of module globals"""
+    factors_to_chord_names, intervals_to_chord_names = {}, {}
+    chord_names_to_factors, chord_names_to_intervals = {}, {}
+    # (while adding chord modifications/alterations as well)
+
+    chord_name_rarities = unpack_and_reverse_dict(chord_names_by_rarity)
+    modifier_name_rarities = unpack_and_reverse_dict(modifier_names_by_rarity)
+
+    # fetch ChordQualifier objects by name just once, rather than for every base chord,
+    # along with the other per-modifier values we need (whether it is indeterminate-quality, and its rarity):
+    ordered_modifiers = []
+    for mod_name in ordered_modifier_names:
+        modifier = qualities.chord_modifiers[mod_name]
+        ordered_modifiers.append((mod_name, modifier, (modifier in ind_modifiers), modifier_name_rarities[mod_name]))
+
+    # the remaining module-level names that get looked up inside the loops, bound locally:
+    unmodifiable_names, intern_name = unmodifiable_chords, intern
+
+    new_rarities = {i: [] for i in range(8)}
+    base_chords = {} # keep the base chords we initialise here, for re-use in the modifier loop
+    for rarity, chord_names in chord_names_by_rarity.items():
+        log(f'Handling base chords for rarity={rarity}, chords={chord_names}')
+
+        for chord_name in chord_names:
+            base_chord = base_chords[chord_name] = AbstractChord(chord_name)
+            log(f'Handling base chord: r:{rarity} {chord_name}')
+
+            if base_chord.factors in factors_to_chord_names or base_chord.intervals in intervals_to_chord_names:
+                log(f'  {chord_name} clash with {intervals_to_chord_names[base_chord.intervals]}')
+            else:
+                factors_to_chord_names[base_chord.factors] = chord_name
+                intervals_to_chord_names[base_chord.intervals] = chord_name
+                chord_names_to_factors[chord_name] = base_chord.factors
+                chord_names_to_intervals[chord_name] = base_chord.intervals
+
+    # handle the modifiers of base chords in a new loop:
+    for rarity, chord_names in chord_names_by_rarity.items():
+        log(f'Handling modifiers for rarity={rarity}, chords={chord_names}')
+
+        for chord_name in chord_names:
+            if chord_name not in unmodifiable_names:
+                base_chord = base_chords[chord_name]
+                base_factors, base_minor = base_chord.factors, base_chord.quality.minor
+                base_rarity = chord_name_rarities[chord_name]
+                # now: add chord modifications to each base chord as well, increasing rarity accordingly
+                for mod_name, modifier, mod_indeterminate, mod_rarity in ordered_modifiers:
+                    # add a modification if it does not already exist by name and is valid on this base chord:
+                    if modifier.valid_on(base_factors):
+                        # (we check if base chord is major because the modifiers on their own apply to major chords,
+                        #  i.e. the chord 'sus2' implies ['' + 'sus2'])
+                        if not (mod_indeterminate and base_minor):
+                            # interned, since these names are used as dict keys in the lookups built from this one:
+                            altered_name = intern_name(chord_name + mod_name)
+
+                            altered_factors = base_factors + modifier
+                            # avoid double counting: e.g. this ensures that '9sus4' and 'm9sus4' are treated as one chord, '9sus4', despite both being a valid chord init
+                            # (the factors are hashed and looked up just once, and we only build the intervals if the factors are new)
+                            factors_are_new = altered_factors not in factors_to_chord_names
+                            altered_intervals = altered_factors.to_intervals() if factors_are_new else None
+                            if factors_are_new and altered_intervals not in intervals_to_chord_names:
+                                factors_to_chord_names[altered_factors] = altered_name
+                                intervals_to_chord_names[altered_intervals] = altered_name
+                                chord_names_to_factors[altered_name] = altered_factors
+                                chord_names_to_intervals[altered_name] = altered_intervals
+
+                                # figure out the rarity of this modification and add it to the rarity dicts:
+                                altered_rarity = base_rarity + mod_rarity
+                                new_rarities[altered_rarity].append(altered_name)
+                                chord_name_rarities[altered_name] = altered_rarity
+
+                                # finally: do the same again, but one level deeper!
+                                for mod_name2 in ordered_modifier_names:
+                                    modifier2 = qualities.chord_modifiers[mod_name] # fetch ChordQualifier object by name
+                                    # do not apply the same modifier twice, and do so only if valid:
+                                    if (modifier2 is not modifier) and modifier2.valid_on(altered_factors):
+                                        if not ((modifier2 in ind_modifiers) and (base_chord.quality.minor)):
+                                            # and, special case, not if (no5) is the first mod, since it always comes last:
+                                            if mod_name != '(no5)':
+                                                altered2_name = altered_name + mod2_name
+
+                                                altered2_factors = altered_factors + modifier2
+                                                altered2_intervals = altered2_factors.to_intervals()
+                                                # avoid the lower triangular: (e.g. m(no5)add9 vs madd9(no5))
+                                                if altered2_factors not in factors_to_chord_names and altered2_intervals not in intervals_to_chord_names:
+                                                    factors_to_chord_names[altered2_factors] = altered2_name
+                                                    intervals_to_chord_names[altered2_intervals] = altered2_name
+                                                    chord_names_to_factors[altered2_name] = altered2_factors
+                                                    chord_names_to_intervals[altered2_name] = altered2_intervals
+
+                                                    # these are all rarity 7, the 'legendary chords'
+                                                    new_rarities[7].append(altered2_name)
+                                                    chord_name_rarities[altered2_name] = 7
+    return (factors_to_chord_names, intervals_to_chord_names, new_rarities,
+            chord_names_to_factors, chord_names_to_intervals, chord_name_rarities)
+
+(factors_to_chord_names, intervals_to_chord_names, new_rarities,
+ chord_names_to_factors, chord_names_to_intervals, chord_name_rarities) = _build_chord_name_lookups(chord_names_by_rarity)
+# these are never modified after being built, so expose them read-only:
+factors_to_chord_names = MappingProxyType(factors_to_chord_names)
+intervals_to_chord_names = MappingProxyType(intervals_to_chord_names)
+# and the same table keyed by tuples of interval values instead, which hash and compare much faster
+# than IntervalLists do (with the same result, since Intervals are equal on value alone):
+interval_values_to_chord_names = MappingProxyType({tuple([i.value for i in ivs]): name for ivs, name in intervals_to_chord_names.items()})
+
+def chord_name_from_intervals(intervals):
+    """returns the chord name that some intervals (from root, in order) map to
+    in intervals_to_chord_names, or None if they are not in there"""
+    return interval_values_to_chord_names.get(tuple([i.value for i in intervals]))
+
+# update chord_names_by_rarity with new rarities,
+# and freeze its name lists as tuples, since they are only ever iterated over from here on:
 for r, names in new_rarities.items():
-    chord_names_by_rarity[r].extend(names)
-
-# re-instantiate the reverse dict since we've added to the forward one (but we still needed it earlier:)
-chord_name_rarities = unpack_and_reverse_dict(chord_names_by_rarity)
-
-# reverse these too:
-chord_names_to_factors = reverse_dict(factors_to_chord_names)
-chord_names_to_intervals = reverse_dict(intervals_to_chord_names)
+    chord_names_by_rarity[r] = tuple(chord_names_by_rarity[r] + names)
+
+def _rotated_masks(offset_mask):
+    """accepts a 12-bit mask of pitch class offsets from a chord's root, and returns the tuple of
+    pitch class masks of that chord on each of the 12 possible roots, indexed by root position"""
+    return tuple([((offset_mask << r) | (offset_mask >> (12 - r))) & 0xFFF for r in range(12)])
+
+def _chord_search_entry(chord_name, rarity):
+    """returns the values that matching_chords needs for a chord name before it builds any Chord objects,
+    as a tuple of: (chord_name, factors, likelihood, offset_counts, root_masks, third_offset, fifth_offset)
+    where offset_counts maps the pitch class offset (from root) of each of the chord's notes to how many
+    factors land on it, root_masks are the 12-bit pitch class masks of its notes on each root (see _rotated_masks),
+    and third_offset and fifth_offset are the offsets of its third and (perfect) fifth, or None if it has no such factor"""
+    factors = chord_names_to_factors[chord_name]
+    factor_intervals = factors.to_intervals(as_dict=True)
+    offset_counts, offset_mask = {}, 0
+    for i in factor_intervals.values():
+        offset = i.value % 12
+        offset_counts[offset] = offset_counts.get(offset, 0) + 1
+        offset_mask |= 1 << offset
+    third_offset = factor_intervals[3].value % 12 if 3 in factor_intervals else None
+    # (only perfect fifths get downweighted, so we don't need to know about any others)
+    fifth_offset = 7 if (5 in factor_intervals and factor_intervals[5].value == 7) else None
+    return chord_name, factors, (10 - rarity) / 10, offset_counts, _rotated_masks(offset_mask), third_offset, fifth_offset
+
+@lru_cache(maxsize=None)
+def _inverted_chord_offsets(chord_name, bass_offset):
+    """returns the pitch class offsets (from root) of the notes of a named chord once it has been
+    inverted over the note at bass_offset, in the same way as Chord._parse_inversion would,
+    as a tuple of: (offset_counts, root_masks, num_notes)
+    (inverted chords can have fewer notes than factors, since inversion drops repeated intervals)"""
+    factors = chord_names_to_factors[chord_name]
+    root_intervals = factors.to_intervals()
+    # the bass sits on the first factor that lands on its pitch class:
+    bass_degree = next(i.extended_degree for i in root_intervals if i.value % 12 == bass_offset)
+    inverted_intervals = root_intervals.invert(factors.degree_places[bass_degree])
+    offset_counts, offset_mask = {}, 0
+    for i in inverted_intervals:
+        offset = (bass_offset + i.value) % 12
+        offset_counts[offset] = offset_counts.get(offset, 0) + 1
+        offset_mask |= 1 << offset
+    return offset_counts, _rotated_masks(offset_mask), len(inverted_intervals)
+
+# matching_chords searches these in the same (rarity) order as chord_names_by_rarity:
+chord_search_table = tuple([_chord_search_entry(chord_name, rarity)
+                            for rarity, chord_names in chord_names_by_rarity.items() for chord_name in chord_names])
 
 ######################################################
 
@@ -1280,63 +1570,127 @@ def matching_chords(note_list, display=True,
     candidates = {} # we'll build a list of Chord object candidates as we go
     # keying candidate chord objs to (rec, prec, likelihood, consonance) tuples
 
+    # we only return the best max_results candidates, so we keep a min-heap of the best scores so far
+    # (with ties broken in favour of earlier candidates, as in the final sort) to skip building
+    # any candidate that scores strictly worse than all of them before we get to its consonance:
+    top_scores = []
+    prune = isinstance(max_results, int) and (max_results > 0)
+    # (or if we return them all, every candidate's ranking scores, in the order they were found)
+    candidate_list, candidate_ranks = [], []
+
     # we'll try building notes starting on every unique note in the note_list
     # (this implicitly means that we require the tonic to be in the input, which is fine)
     unique_notes = note_list.unique()
+    bass_note = note_list[0]
+    first_position = bass_note.position
 
+    # the input notes as a 12-bit mask of pitch classes, so that we can score candidates
+    # (as precision_recall would) with integer operations instead of comparing Note objects:
+    query_mask = 0
     for n in unique_notes:
-        for rarity, chord_names in chord_names_by_rarity.items():
+        query_mask |= 1 << n.position
+    num_unique = len(unique_notes)
 
-            # (no5) is already a missing degree, so we don't search chords that include it:
-            # names_to_try = [n for n in chord_names if '(no5)' not in n]
-            names_to_try = chord_names
+    for n in unique_notes:
+        root_position = n.position
+        # (no5) is already a missing degree, so we don't search chords that include it:
+        # names_to_try = [n for n in chord_names if '(no5)' not in n]
+        for chord_name, cand_factors, likelihood, cand_offsets, cand_masks, third_offset, fifth_offset in chord_search_table:
+            # likelihood is a float from 0.3 to 1.0
+
+            # the table is in rarity order, so likelihood only falls from here on for this root.
+            # stop once no remaining chord can make the cut, even with perfect recall and precision:
+            if likelihood < min_likelihood:
+                break
+            if prune and (len(top_scores) == max_results) and ((1.0, 1.0, round(likelihood, 2)) < top_scores[0][:3]):
+                break
+
+            # if candidate doesn't share the 'root', we can invert it.
+            # we work this out from pitch classes alone, so that we only build the Chord if we need it:
+            inverted = False
+            if root_position != first_position:
+                if invert and ((cand_masks[root_position] >> first_position) & 1):
+                    inverted = True
+                    # or otherwise just assume the note_list's root and make the non-inversion slightly less likely:
+                elif assume_root:
+                    likelihood -= 0.15 # increase rarity by one-and-a-half steps
+
+            # if require root, we only accept chords that share the bass note with the note_list:
+            if require_root and (not inverted) and (root_position != first_position):
+                continue
+
+            if inverted:
+                # (inversion can change which notes the chord ends up with)
+                cand_offsets, cand_masks, num_retrieved = _inverted_chord_offsets(chord_name, (first_position - root_position) % 12)
+            else:
+                num_retrieved = len(cand_factors)
+            # the pitch classes of the candidate's notes on this root, precomputed for every root:
+            cand_mask = cand_masks[root_position]
+
+            # weighted precision and recall of the candidate's notes against the unique input notes,
+            # where every note counts as 1 except for the weighted third and fifth:
+            num_relevant = num_unique
+            relevant_retrieved = bin(query_mask & cand_mask).count('1')
+            # upweight the third if asked for:
+            if upweight_third and (third_offset is not None):
+                num_retrieved += cand_offsets.get(third_offset, 0) # (each note on the third counts 2 instead of 1)
+                third_bit = 1 << ((root_position + third_offset) % 12)
+                if query_mask & third_bit:
+                    num_relevant += 1
+                    if cand_mask & third_bit:
+                        relevant_retrieved += 1
+            # only downweight perfect fifths:
+            if downweight_fifth and (fifth_offset is not None):
+                num_retrieved -= 0.5 * cand_offsets.get(fifth_offset, 0) # (and each on the fifth counts 0.5)
+                fifth_bit = 1 << ((root_position + fifth_offset) % 12)
+                if query_mask & fifth_bit:
+                    num_relevant -= 0.5
+                    if cand_mask & fifth_bit:
+                        relevant_retrieved -= 0.5
+            precision = relevant_retrieved / num_retrieved
+            recall = relevant_retrieved / num_relevant
+
+            # only build the Chord for candidates that make the cut:
+            if recall >= min_recall and precision >= min_precision and likelihood >= min_likelihood:
+                scores = (round(recall, 2), round(precision, 2), round(likelihood, 2))
+                if prune and (len(top_scores) == max_results) and (scores < top_scores[0][:3]):
+                    continue
 
-            for chord_name in names_to_try:
                 # init chord more efficiently than by name:
-                cand_factors = chord_names_to_factors[chord_name]
                 candidate = Chord(factors=cand_factors, root=n)
-
-                likelihood = candidate.likelihood # float from 0.3 to 1.0
-
-                # if candidate doesn't share the 'root', we can invert it:
-                if (candidate.root != note_list[0]):
-                    if invert and (note_list[0] in candidate.notes):
-                        candidate = candidate.invert(bass=note_list[0])
-                        # or otherwise just assume the note_list's root and make the non-inversion slightly less likely:
-                    elif assume_root:
-                        likelihood -= 0.15 # increase rarity by one-and-a-half steps
-
-                weights = {}
-                # upweight the third if asked for:
-                if (upweight_third) and (3 in candidate.factors):
-                    weights[candidate.factor_notes[3]] = 2
-                # only downweight perfect fifths:
-                if (downweight_fifth) and (5 in candidate.factors) and (candidate.factor_intervals[5]==7):
-                    weights[candidate.factor_notes[5]] = 0.5
-                # if require root, we only accept chords that share the bass note with the note_list:
-                if (not require_root) or (candidate.bass == note_list[0]):
-                    precision, recall = precision_recall(unique_notes, candidate.notes, weights=weights)
-                    consonance = candidate.consonance # float from ~0.4 to ~0.9, in principle
-
-                    if recall >= min_recall and precision >= min_precision and likelihood >= min_likelihood:
-                        candidates[candidate] = {   'recall': round(recall,    2),
-                                                 'precision': round(precision, 2),
-                                                'likelihood': round(likelihood,2),
-                                                'consonance': round(consonance,3)}
-
-    # return sorted candidates dict:
-    sorted_cands = sorted(candidates,
-                          key=lambda c: (candidates[c]['recall'],
-                                         candidates[c]['precision'],
-                                         candidates[c]['likelihood'],
-                                         candidates[c]['consonance']),
-                          reverse=True)[:max_results]
+                if inverted:
+                    candidate = candidate.invert(bass=bass_note)
+                consonance = round(candidate.consonance, 3) # float from ~0.4 to ~0.9, in principle
+
+                ranked_scores = (*scores, consonance, -len(candidate_list))
+                candidate_list.append(candidate)
+                if prune:
+                    if len(top_scores) < max_results:
+                        heappush(top_scores, ranked_scores)
+                    elif ranked_scores > top_scores[0]:
+                        heapreplace(top_scores, ranked_scores)
+                else:
+                    candidate_ranks.append(ranked_scores)
+
+                candidates[candidate] = {   'recall': scores[0],
+                                         'precision': scores[1],
+                                        'likelihood': scores[2],
+                                        'consonance': consonance}
+
+    # return sorted candidates dict, sorting on the score tuples (whose last item is the
+    # negative index of each candidate, so that ties go to earlier candidates, as in a stable sort):
+    if prune:
+        # the heap already holds exactly the best scores:
+        best_ranks = sorted(top_scores, reverse=True)
+    else:
+        best_ranks = sorted(candidate_ranks, reverse=True)[:max_results]
+    sorted_cands = [candidate_list[-ranked_scores[-1]] for ranked_scores in best_ranks]
 
     if display:
         # print result as nice dataframe instead of returning a dict
         title = [f"Chord matches for notes: {note_list}"]
         if assume_root:
-            title.append(f'(assumed root: {note_list[0].name})')
+            title.append(f'(assumed root: {bass_note.name})')
         if not invert:
             title.append('(inversions disallowed)')
         else:
@@ -1353,8 +1707,8 @@ def matching_chords(note_list, display=True,
             str_parts = str(cand).split(' ')
             chord_name_parts.append(' '.join(str_parts[:2]))
             note_list_parts.append(' '.join(str_parts[2:]))
-        longest_name_len = max([len(str(s)) for s in (chord_name_parts + ['  chord name'])])+3
-        longest_notes_len = max([len(str(s)) for s in (note_list_parts + ['    notes'])])+3
+        longest_name_len = max(max(map(len, chord_name_parts), default=0), len('  chord name'))+3
+        longest_notes_len = max(max(map(len, note_list_parts), default=0), len('    notes'))+3
 
         left_header =f"{'  chord name':{longest_name_len}} {'    notes':{longest_notes_len}}"
         score_parts = ['recall', 'precision', 'lklihood', 'consonance']
@@ -1362,13 +1716,12 @@ def matching_chords(note_list, display=True,
         right_header = ' '.join([f'{h:{hspace}}' for h in score_parts])
         out_list = [left_header + right_header]
 
-        combi_chars = {"\u0324", "\u0323", "\u0307", "\u0308"} # a kludge: we have to count combining characters separately for chord notelist formatting
-
         for i, cand in enumerate(sorted_cands):
             scores = candidates[cand]
             rec, prec, lik, cons = list(scores.values())
             name_str, notes_str = chord_name_parts[i], note_list_parts[i]
-            num_combi_chars = len([c for c in notes_str if c in combi_chars])
+            # a kludge: we have to count combining characters separately for chord notelist formatting
+            num_combi_chars = len(notes_str) - len(notes_str.translate(_strip_accent_marks))
 
             descriptor = f'{name_str:{longest_name_len}} {notes_str:{longest_notes_len + num_combi_chars}}'
             scores = f' {str(rec):{hspace}} {str(prec):{hspace}}  {str(lik):{hspace}}  {cons:.03f}'
@@ -1386,8 +1739,11 @@ def most_likely_chord(note_list, stats=False, **kwargs):
     for kwarg in ['min_precision', 'min_recall', 'min_likelihood']:
         if kwarg not in kwargs:
             kwargs[kwarg] = 0.0
+    # and we only want the single best candidate, so matching_chords can skip any that can't beat it:
+    if 'max_results' not in kwargs:
+        kwargs['max_results'] = 1
     candidates = matching_chords(note_list, display=False, **kwargs)
-    best_match = list(candidates.keys())[0]
+    best_match = next(iter(candidates))
     match_params = candidates[best_match]
     if stats:
         return best_match, match_params
@@ -1401,6 +1757,9 @@ class ChordVoicing(Chord):
     unlike its parent classes, a ChordVoicing can have repeats of the same Note at multiple pitches.
 
     exact same attributes as chord, except also having a self.octave attribute defined"""
+    # (only the extra attribute, the rest are in Chord's slots)
+    __slots__ = ('octave',)
+
     def __init__(self, name=None, root=None, octave=None, factors=None, intervals=None, inversion=None, qualifiers=None, in_key=None):
 
         self.root, self.octave, chord_name = self._parse_root_octave(name, root, octave)
@@ -1418,21 +1777,20 @@ class ChordVoicing(Chord):
         if name is not None:
             assert root is None, f"ChordVoicing initialised with name string ({name}) as root, but also received mutually exclusive root keyword: {root}"
             assert octave is not None, f"ChordVoicing initialised with name string ({name}) as root but no octave arg provided"
-            root_name, chord_name = parsing.note_split(name)
+            root_name, chord_name = _split_root_name(name)
             root = Note(root_name)
             if len(chord_name) == 0:
                 chord_name = None
             return root, octave, chord_name
         else:
+            # the octave comes from exactly one of: the root itself, or the octave arg
             if isinstance(root, OctaveNote):
                 # if root is an OctaveNote, we accept that:
-                root = root
                 assert octave is None, f"ChordVoicing initialised with OctaveNote ({root}) as root but also received mutually exclusive octave keyword: {octave}"
                 octave = root.octave
             elif isinstance(root, Note):
                 assert octave is not None, f"ChordVoicing initialised with Note ({root}) as root but no octave arg provided"
                 root = root.in_octave(octave)
-                octave = octave
             elif isinstance(root, str):
                 if root[-1].isnumeric():
                     # string that seems to be an OctaveNote
@@ -1441,6 +1799,7 @@ class ChordVoicing(Chord):
                     octave = root.octave
                 else:
                     assert octave is not None, f"ChordVoicing initialised with Note string ({root}) as root but no octave arg provided"
-                    octave = octave
                     root = Note(root).in_octave(octave)
+            else:
+                raise TypeError(f'ChordVoicing expected root to be a Note, OctaveNote or string, but got: {type(root)}')
             return root, octave, name
@@ -1,24 +1,32 @@
 from .qualities import Quality #, Major, Minor, Perfect, Augmented, Diminished
 from .parsing import degree_names, num_suffixes, offset_accidentals
-from .util import rotate_list, least_common_multiple, euclidean_gcd
+from .util import rotate_list
 from .conversion import value_to_pitch
 import math
+from functools import lru_cache
 
 class Interval:
     """a signed distance between notes, defined in semitones and degrees (whole-tones).
     infers degree from semitone distance automatically,
     but degree can be specified explicitly to infer an
     augmented or diminished interval etc."""
+    __slots__ = ('value', 'width', 'compound', 'octave_span', 'mod', 'sign', 'ascending', 'descending', 'unison',
+                 'degree', 'extended_degree', 'quality', '_ratio', '_consonance', '_hash',
+                 '_name', '_short_name', '_factor_name')
 
     def __init__(self, value:int, degree=None):
         if isinstance(value, Interval):
             # accept re-casting from another interval object:
-            if degree is None:
-                degree = value.extended_degree
+            if degree is None or degree == value.extended_degree:
+                # same value and degree, so we can copy everything else across rather than work it out again:
+                self._copy_attributes(value)
+                return
             # changed this to let degree kwarg overwrite init by interval
             value = value.value
 
         self.value = value # signed integer semitone distance
+        # intervals only hash their values, which never change, so we hash just the once:
+        self._hash = hash(value)
 
         # value is directional, but width is absolute:
         self.width = abs(value)
@@ -37,7 +45,7 @@ class Interval:
 
         if degree is None:
             # no degree provided, so auto-detect degree by assuming ordinary diatonic intervals:
-            self.degree = default_interval_degrees[self.mod] # * self.sign
+            self.degree = mod_degrees[self.mod] # * self.sign
 
             # self.extended_degree is >=8 if this is a ninth or eleventh etc,
             # but self.degree is always mod-7,
@@ -48,7 +56,7 @@ class Interval:
             assert degree > 0, "Interval degree must be non-negative"
 
             # degree has been provided; we validate it here
-            default_degree = (default_interval_degrees[self.mod] + (7*self.octave_span)) #* self.sign
+            default_degree = (mod_degrees[self.mod] + (7*self.octave_span)) #* self.sign
             self.extended_degree = degree # * self.sign
             self.degree = (self.extended_degree - (7*self.octave_span)) #  * self.sign
             if self.unison:
@@ -76,13 +84,20 @@ class Interval:
         # determine this interval's quality:
         self.quality = self._detect_quality()
 
+    def _copy_attributes(self, other):
+        """sets the attributes of this interval to those of another, for re-casting in __init__"""
+        self.value, self._hash, self.width, self.compound = other.value, other._hash, other.width, other.compound
+        self.octave_span, self.mod, self.sign = other.octave_span, other.mod, other.sign
+        self.ascending, self.descending, self.unison = other.ascending, other.descending, other.unison
+        self.degree, self.extended_degree, self.quality = other.degree, other.extended_degree, other.quality
+
     def _detect_quality(self):
         """uses mod-value and mod-degree to determine the quality of this interval"""
 
-        default_value = default_degree_intervals[self.degree]
+        default_value = degree_default_values[self.degree]
         offset = (self.mod - default_value)
 
-        if self.degree in perfect_degrees:
+        if degree_is_perfect[self.degree]:
             quality = Quality.from_offset_wrt_perfect(offset)
         else: # non-perfect degree, major by default
             quality = Quality.from_offset_wrt_major(offset)
@@ -90,8 +105,14 @@ class Interval:
 
     @property
     def ratio(self):
+        """this interval's just ratio, as a tuple of (left, right) integers
+        (computed on first access and cached thereafter)"""
+        try:
+            return self._ratio
+        except AttributeError:
+            pass
         if self.value in interval_ratios:
-            return interval_ratios[self.value]
+            self._ratio = interval_ratios[self.value]
         else:
             # this is an extended interval that we don't have a just ratio for,
             # but we can say it's just the ratio of its mod, with the left side
@@ -99,24 +120,33 @@ class Interval:
             left, right = interval_ratios[self.mod]
             left *= (2**self.octave_span)
             # reduce to simple form:
-            gcd = euclidean_gcd(left, right)
-            return (left // gcd, right // gcd)
+            gcd = math.gcd(left, right)
+            self._ratio = (left // gcd, right // gcd)
+        return self._ratio
 
     @property
     def consonance(self):
         """consonance of an interval, defined as
         the base2 log of the least common multiple of
-        the sides of that interval's ratio"""
+        the sides of that interval's ratio
+        (computed on first access and cached thereafter)"""
+        try:
+            return self._consonance
+        except AttributeError:
+            pass
         l, r = self.ratio
         # calculate least common multiple of simple form:
-        lcm = least_common_multiple(l,r)
+        # (math.lcm is python 3.9+, so we get it from the builtin gcd instead)
+        lcm = (l * r) // math.gcd(l, r)
         # log2 of that multiple:
+        # (as log(x, 2) rather than log2, which can differ in the last bit and reorder ties in chord matching)
         dissonance = math.log(lcm, 2)
         # this ends up as a number that ranges from 0 (for perfect unison)
         # to just under 15, (for the 7-octave compound minor second, of width 85)
 
         # so we invert it into a consonance between 0-1:
-        return (15 - dissonance) / 15
+        self._consonance = (15 - dissonance) / 15
+        return self._consonance
 
 
     @staticmethod
@@ -153,7 +183,7 @@ class Interval:
     @property
     def offset_from_default(self):
         """how many semitones this interval is from its default/canonical (perfect/major) degree"""
-        perfect_degree = self.degree in {1,4,5}
+        perfect_degree = degree_is_perfect[self.degree]
         offset = self.quality.offset_wrt_perfect if perfect_degree else self.quality.offset_wrt_major
         return offset
         # return self.offset_from_default_degree(self.degree)
@@ -163,7 +193,7 @@ class Interval:
         assert degree > 0
         deg_oct, mod_degree = (divmod(degree-1, 7))
         mod_degree += 1
-        default_value = default_degree_intervals[mod_degree] + (12*deg_oct)
+        default_value = degree_default_values[mod_degree] + (12*deg_oct)
         offset = self.width - default_value
         return offset
 
@@ -178,15 +208,16 @@ class Interval:
         #     operand = other
 
         if isinstance(other, (int, Interval)):
-            new_value = self.value + int(other)
+            operand = other.value if isinstance(other, Interval) else other
+            new_value = self.value + operand
             # result = Interval(new_value)
             # catch special case: addition/subtraction by octaves preserves this interval's degree/quality,
             # (except if there's been a sign change)
             if (self.mod == 0):
                 # (but don't worry about it for addition/subtraction of unisons themselves)
                 return Interval.from_cache(new_value)
-            elif int(other) % 12 == 0:
-                octave_of_addition = int(other) // 12
+            elif operand % 12 == 0:
+                octave_of_addition = operand // 12
                 # new_degree = ((((self.sign * self.extended_degree) + octave_of_addition) - 1) % 7) + 1
                 new_sign = -1 if new_value < 0 else 1
                 # invert the degree if there's been a sign change
@@ -198,7 +229,11 @@ class Interval:
                 # if new_sign != self.sign:
                 #     new_degree -= 7
 
-                result = Interval(new_value, new_ext_degree)
+                if new_degree == mod_degrees[abs(new_value) % 12]:
+                    # the result has the default degree for its value anyway, so we can use the cache:
+                    result = Interval.from_cache(new_value)
+                else:
+                    result = Interval(new_value, new_ext_degree)
             else:
                 # return cached interval if it exists:
                 result = Interval.from_cache(new_value)
@@ -218,7 +253,8 @@ class Interval:
     def __sub__(self, other):
         if isinstance(other, (int, Interval)):
             # call __add__ method recursively:
-            return self + (-other)
+            # (with the negated value, which adds the same as the negated Interval would, without building one)
+            return self + (-int(other))
         #     return Interval(self.value - other.value)
         # elif isinstance(other, int):
         #     return Interval(self.value - other)
@@ -232,6 +268,10 @@ class Interval:
     def __neg__(self):
         if self.value == 0:
             return self
+        elif self.degree == mod_degrees[self.mod]:
+            # the negative of a default-degree interval is a default-degree interval too,
+            # so we can return the cached one if it exists:
+            return Interval.from_cache(-self.value)
         else:
             return Interval(-self.value, self.extended_degree)
 
@@ -260,6 +300,9 @@ class Interval:
         if self.value < 0:
             # invert before flattening:
             return (~self).flatten()
+        elif self.degree == mod_degrees[self.mod]:
+            # a default-degree interval flattens to the (cached) default interval of its mod:
+            return cached_intervals[self.mod]
         else:
             return Interval(self.mod, degree=self.degree)
 
@@ -293,7 +336,12 @@ class Interval:
             raise TypeError('Intervals can only be compared to integers or other Intervals')
 
     def __le__(self, other):
-        return other >= self
+        if isinstance(other, Interval):
+            return self.value <= other.value
+        elif isinstance(other, int):
+            return self.value <= other
+        else:
+            raise TypeError('Intervals can only be compared to integers or other Intervals')
 
     def __lt__(self, other):
         if isinstance(other, Interval):
@@ -304,7 +352,12 @@ class Interval:
             raise TypeError('Intervals can only be compared to integers or other Intervals')
 
     def __gt__(self, other):
-        return other < self
+        if isinstance(other, Interval):
+            return self.value > other.value
+        elif isinstance(other, int):
+            return self.value > other
+        else:
+            raise TypeError('Intervals can only be compared to integers or other Intervals')
 
     def __int__(self):
         return self.value
@@ -314,10 +367,19 @@ class Interval:
 
     def __hash__(self):
         """intervals only hash their values, not their degrees"""
-        return hash(self.value)
+        return self._hash
 
     @property
     def name(self):
+        """full name of this interval, like 'Minor Third (descending)'
+        (built on first access and cached thereafter, like short_name and factor_name)"""
+        try:
+            return self._name
+        except AttributeError:
+            self._name = self._build_name()
+            return self._name
+
+    def _build_name(self):
         if self.extended_degree in degree_names:
             # interval degree is at most a thirteenth:
             degree_name = degree_names[self.extended_degree]
@@ -343,26 +405,35 @@ class Interval:
 
     @property
     def short_name(self):
+        try:
+            return self._short_name
+        except AttributeError:
+            pass
         lb, rb = self._brackets
         if self.value == 0:
-            return '‹Rt›'
+            self._short_name = '‹Rt›'
         else:
             sign_str = '-' if self.sign == -1 else ''
             short_deg = f'{self.extended_degree}'
-            return f'{lb}{sign_str}{self.quality.short_name}{short_deg}{rb}'
+            self._short_name = f'{lb}{sign_str}{self.quality.short_name}{short_deg}{rb}'
+        return self._short_name
 
 
     # alternate str method:
     @property
     def factor_name(self):
+        try:
+            return self._factor_name
+        except AttributeError:
+            pass
         # display this interval as an accidental and a degree:
         acc = offset_accidentals[self.offset_from_default][0]
         sign_str = '' if self.sign == 1 else '-'
-        return f'{sign_str}{acc}{self.extended_degree}'
+        self._factor_name = f'{sign_str}{acc}{self.extended_degree}'
+        return self._factor_name
 
-    @property
-    def _brackets(self):
-        return '‹', '›'
+    # (a plain class attribute, since these never change)
+    _brackets = ('‹', '›')
 
     def __str__(self):
         lb, rb = self._brackets
@@ -375,14 +446,17 @@ class Interval:
     def from_cache(value):
         # return a cached Interval object with this value if it exists,
         # otherwise initialise a new one
-        if value in cached_intervals:
+        try:
             return cached_intervals[value]
-        else:
+        except KeyError:
             return Interval(value)
 
 class IntervalList(list):
     """List subclass that is instantianted with an iterable of Interval-like objects and forces them all to Interval type".
     useful for representing the attributes of e.g. AbstractChords and Scales."""
+    # (only the one attribute on top of the list itself)
+    __slots__ = ('value_set',)
+
     def __init__(self, *items):
         if len(items) == 1 and isinstance(items[0], (list, tuple)):
             # been passed a list of items, instead of a series of list items
@@ -394,21 +468,10 @@ class IntervalList(list):
 
     @staticmethod
     def _cast_intervals(items):
-        interval_items = []
-        for item in items:
-            if isinstance(item, Interval):
-                # add note
-                interval_items.append(item)
-            elif isinstance(item, int):
-                # cast int to interval (using cache if it exists)
-                interval_items.append(Interval.from_cache(item))
-            else:
-                raise Exception('IntervalList can only be initialised with Intervals, or ints that cast to Intervals')
-        return interval_items
+        # (items are usually Intervals already, which we keep as they are)
+        return [item if isinstance(item, Interval) else _cast_interval(item) for item in items]
 
-    @property
-    def _brackets(self):
-        return '𝄁', ' 𝄁'
+    _brackets = ('𝄁', ' 𝄁')
 
     def __str__(self):
         lb, rb = self._brackets
@@ -479,28 +542,38 @@ class IntervalList(list):
 
     def __hash__(self):
         """IntervalLists hash as sorted tuples for the purposes of chord/key reidentification"""
-        return hash(tuple(self.sorted()))
+        # Intervals hash as their values, so hashing the sorted tuple of values gives the same
+        # result without sorting (and re-casting) the Interval objects themselves:
+        return hash(tuple(sorted([i.value for i in self])))
 
     def __contains__(self, item):
         """check if interval with a value (not degree) of item is contained inside this IntervalList,
         using self.value_set for efficient lookup"""
-        if isinstance(item, Interval):
-            item = item.value
-        return item in self.value_set
+        return (item.value if type(item) is Interval else item) in self.value_set
 
     def append(self, item):
         """as list.append, but updates our set object as well"""
         super().append(item)
-        self.value_set = set([s.value for s in self])
+        self.value_set.add(item.value)
 
     def remove(self, item):
+        """as list.remove, but updates our set object as well"""
         super().remove(item)
-        self.value_set = set([s.value for s in self])
+        self._discard_value(item.value if isinstance(item, Interval) else item)
+
+    def pop(self, index=-1):
+        """as list.pop, but updates our set object as well"""
+        popped_item = super().pop(index)
+        self._discard_value(popped_item.value)
+        return popped_item
 
-    def pop(self, item):
-        popped_item = self[-1]
-        del self[-1]
-        self.value_set = set([s.value for s in self])
+    def _discard_value(self, value):
+        """drops a value from our set object after an interval with that value has been removed,
+        unless another interval in this list still has it"""
+        for i in self:
+            if i.value == value:
+                return
+        self.value_set.discard(value)
 
     def unique(self):
         """returns a new IntervalList, where repeated notes are dropped after the first"""
@@ -520,6 +593,11 @@ class IntervalList(list):
         # we must use this instead
         return IntervalList(sorted(self))
 
+    def is_sorted(self):
+        """returns True if this list is in ascending order, i.e. equal to self.sorted()"""
+        values = [i.value for i in self]
+        return values == sorted(values)
+
     def strip(self):
         """remove unison intervals from start and end of this list"""
         if self[0].mod == 0:
@@ -532,7 +610,8 @@ class IntervalList(list):
 
     def pad(self, left=True, right=False):
         """if this list does NOT start and/or end with unisons, add them where appropriate"""
-        assert self == self.sorted(), f'non-sorted IntervalLists should NOT be padded'
+        # (Intervals sort by value, so we check the values directly rather than building a sorted copy)
+        assert self.is_sorted(), f'non-sorted IntervalLists should NOT be padded'
         if (self[0].mod != 0) and left:
             new_intervals = [Interval(0)] + self[:]
         else:
@@ -547,9 +626,16 @@ class IntervalList(list):
         """flatten all intervals in this list and return them as a new (sorted) list.
         if duplicates=False, remove those that are non-unique. else, keep them. """
         new_intervals = [i.flatten() for i in self]
-        if not duplicates:
-            new_intervals = list(set(new_intervals))
-        return IntervalList(sorted(new_intervals))
+        if duplicates:
+            return IntervalList(sorted(new_intervals))
+        else:
+            # flattened values are all from 0 to 11, so we keep the first interval of each value
+            # in a slot by value, which also leaves them in sorted order:
+            value_slots = [None] * 12
+            for i in new_intervals:
+                if value_slots[i.value] is None:
+                    value_slots[i.value] = i
+            return IntervalList([i for i in value_slots if i is not None])
 
     def rotate(self, num_places):
         """returns the rotated IntervalList that begins num_steps up
@@ -559,14 +645,9 @@ class IntervalList(list):
     def invert(self, position):
         """used for calculating inversions: rotates, then subtracts
         the value of the resulting first interval in list, and returns
-        those inverted intervals as a new IntervalList"""
-        rotated = self.rotate(position)
-        recentred = rotated - rotated[0] # centres first interval to be root again
-        positive = abs(recentred) # inverts any negative intervals to their positive inversions
-        inverted = positive.unique().sorted()
-        # inverted = recentred.flatten()   # inverts negative intervals to their correct values
-        # inverted = IntervalList(list(set([~i if i < 0 else i for i in recentred]))).sorted()
-        return inverted
+        those inverted intervals as a new IntervalList."""
+        interval_items = tuple([(i.value, i.extended_degree) for i in self])
+        return IntervalList(_cached_inversion(interval_items, position))
 
     def stack(self):
         """equivalent to cumsum: returns a new IntervalList based on the successive
@@ -581,7 +662,7 @@ class IntervalList(list):
         """inverse operation - assume we are already stacked as intervals from tonic,
         and recover the original stacked intervals.
         e.g. [M3, P5, M7, m10].unstack() returns [M3, m3, M3, M3]"""
-        assert self == self.sorted(), f'Cannot unstack an un-ordered IntervalList: {self}'
+        assert self.is_sorted(), f'Cannot unstack an un-ordered IntervalList: {self}'
         interval_unstack = self[:1]
         for i in range(1, len(self)):
             interval_unstack.append(self[i] - self[i-1])
@@ -590,6 +671,14 @@ class IntervalList(list):
 # quality-of-life alias:
 Intervals = IntervalList
 
+def _cast_interval(item):
+    """casts a non-Interval item of an IntervalList to an Interval, for IntervalList._cast_intervals"""
+    if isinstance(item, int):
+        # cast int to interval (using cache if it exists)
+        return Interval.from_cache(item)
+    else:
+        raise Exception('IntervalList can only be initialised with Intervals, or ints that cast to Intervals')
+
 # # from a list of intervals-from-tonic (e.g. a key specification), get the corresponding stacked intervals:
 # def stacked_intervals(tonic_intervals):
 #     stack = [tonic_intervals[0]]
@@ -639,6 +728,12 @@ default_degree_intervals = {
                 # 8: 12, # octave
                 }
 
+# the same three mappings as tuples, indexed directly by mod-value or mod-degree,
+# for the lookups that every Interval init makes: (degrees start at 1, so index 0 is unused)
+mod_degrees = tuple([default_interval_degrees[m] for m in range(12)])
+degree_default_values = (None,) + tuple([default_degree_intervals[d] for d in range(1, 8)])
+degree_is_perfect = tuple([d in perfect_degrees for d in range(8)])
+
 
 
 
@@ -704,6 +799,71 @@ AugmentedThirteenth = AugThirteenth = Augmented13th = Aug13th = Aug13 = A13 = In
 common_intervals = [P1, m2, M2, m3, M3, P4, d5, P5, m6, M6, m7, M7, P8, m9, M9, m10, M10, P11, P12, m13, M13]
 # cache common intervals by semitone value for efficiency:
 cached_intervals = {c.value: c for c in common_intervals}
+# as well as every other interval within two octaves either way, at its default degree,
+# so that interval arithmetic on the hot path almost never has to build a new Interval:
+for _value in range(-24, 25):
+    if _value not in cached_intervals:
+        cached_intervals[_value] = Interval(_value)
+
+@lru_cache(maxsize=4096)
+def _cached_inversion(interval_items, position):
+    """returns the intervals of IntervalList.invert as a tuple of Intervals, from a tuple
+    of (value, extended_degree) pairs that identify the intervals to be inverted.
+    the same few chord inversions get computed over and over, so results are memoised here"""
+    # (rotate, recentre, make positive, drop repeats and sort, all in one pass over the intervals
+    #  rather than building an intermediate IntervalList for each step)
+    rotated = rotate_list([Interval(v, degree=d) for v, d in interval_items], position)
+    bass_value = rotated[0].value
+    inverted, inverted_values = [], set()
+    for i in rotated:
+        recentred = i - bass_value # centres first interval to be root again
+        if recentred < 0:
+            recentred = ~recentred # inverts negative intervals to their positive inversions
+        if recentred.value not in inverted_values:
+            inverted.append(recentred)
+            inverted_values.add(recentred.value)
+    inverted.sort()
+    # inverted = recentred.flatten()   # inverts negative intervals to their correct values
+    # inverted = IntervalList(list(set([~i if i < 0 else i for i in recentred]))).sorted()
+    return tuple(inverted)
+
+# pool of interned Intervals keyed by (degree, offset), as used for chord factors,
+# so that each is built only once rather than on every chord initialisation:
+_degree_interval_pool = {}
+
+def interval_from_degree(degree, offset=0):
+    """returns the shared Interval object for some degree and offset,
+    equivalent to Interval.from_degree(degree, offset=offset).
+    these are shared between callers, so should be treated as immutable"""
+    key = (degree, offset)
+    try:
+        return _degree_interval_pool[key]
+    except KeyError:
+        interval = _degree_interval_pool[key] = Interval.from_degree(degree, offset=offset)
+        return interval
+
+# pre-fill the pool with the degrees and offsets that chord factors are made of,
+# so that lookups on the hot path are a single dict hit from the start:
+for _deg in range(1, 14):
+    for _offset in range(-2, 3):
+        try:
+            interval_from_degree(_deg, _offset)
+        except AssertionError:
+            # not every degree/offset combination is a valid interval
+            pass
+
+# an interval's consonance depends only on its value, so is memoised by value here,
+# for consonance calculations that would otherwise build an Interval for every pair of notes:
+_value_consonances = {}
+
+def interval_consonance(value):
+    """returns the consonance of the interval with this value,
+    equivalent to Interval(value).consonance"""
+    try:
+        return _value_consonances[value]
+    except KeyError:
+        consonance = _value_consonances[value] = Interval.from_cache(value).consonance
+        return consonance
 
 # interval whole-number ratios according to five-limit tuning just intonation:
 interval_ratios = {0: (1,1),  1: (16,15),  2: (9,8),    3: (6,5),
@@ -1,11 +1,13 @@
 from .intervals import Interval, IntervalList
 from .notes import Note, NoteList, sharp_major_tonics, sharp_minor_tonics, flat_major_tonics, flat_minor_tonics, relative_majors, relative_minors
+from .notes import sharp_major_tonic_positions, sharp_minor_tonic_positions, flat_major_tonic_positions, flat_minor_tonic_positions
 from .scales import Scale, Subscale, NaturalMajor, NaturalMinor, interval_mode_names, parallel_scales
 from .chords import Chord, AbstractChord
 from . import parsing
 from .util import check_all, precision_recall, reverse_dict, log
 
 from collections import Counter
+from functools import lru_cache
 from pdb import set_trace
 
 # natural notes in order of which are flattened/sharpened in a key signature:
@@ -16,6 +18,14 @@ sharp_order = ['F', 'C', 'G', 'D', 'A', 'E', 'B']
 co5s_clockwise = {Note('C')+(7*i) : Note('C')+(7*(i+1)) for i in range(12)}
 co5s_counterclockwise = {Note('C')-(7*i) : Note('C')-(7*(i+1)) for i in range(12)}
 
+@lru_cache(maxsize=4096)
+def _split_key_name(name):
+    """splits a Key name like 'Bb harmonic minor' into a (tonic_name, scale_name) tuple.
+    the Key object itself is mutable and gets built fresh each time,
+    but the string parsing depends only on the name, so is memoised here"""
+    tonic_name, scale_name = parsing.note_split(name)
+    return tonic_name, scale_name.strip()
+
 class Key(Scale):
     """a Scale that is also rooted on a tonic, and therefore associated with a set of notes"""
     def __init__(self, scale_name=None, intervals=None, tonic=None, notes=None, mode=1, chromatic_intervals=None, chromatic_notes=None, stacked=True, alias=None):
@@ -93,8 +103,7 @@ class Key(Scale):
             if parsing.begins_with_valid_note_name(name):
                 # parse as the name of a Key:
                 assert tonic is None, f'Key object initiated by Key name ({name}) but provided conflicting tonic arg ({tonic})'
-                tonic, scale_name = parsing.note_split(name)
-                scale_name = scale_name.strip()
+                tonic, scale_name = _split_key_name(name)
             else:
                 assert tonic is not None, f'Key object initiated by Scale name ({name}) but no tonic note provided'
                 scale_name = name
@@ -109,9 +118,10 @@ class Key(Scale):
     def _detect_sharp_preference(self, default=False):
         """detect if this key's tonic note should prefer sharp or flat labelling
         depending on its chroma and quality"""
-        if (self.quality.major and self.tonic in sharp_major_tonics) or (self.quality.minor and self.tonic in sharp_minor_tonics):
+        tonic_pos = self.tonic.position
+        if (self.quality.major and tonic_pos in sharp_major_tonic_positions) or (self.quality.minor and tonic_pos in sharp_minor_tonic_positions):
             return True
-        elif (self.quality.major and self.tonic in flat_major_tonics) or (self.quality.minor and self.tonic in flat_minor_tonics):
+        elif (self.quality.major and tonic_pos in flat_major_tonic_positions) or (self.quality.minor and tonic_pos in flat_minor_tonic_positions):
             return False
         else:
             return default
@@ -334,25 +344,40 @@ class Key(Scale):
         if isinstance(item, (Interval, int)):
             return Interval(item) in self.intervals
         elif isinstance(item, Note) or (isinstance(item, str) and parsing.is_valid_note_name(item)):
-            return item in self.notes
+            if isinstance(item, str):
+                item = Note(item)
+            if type(item) is Note:
+                # notes are equal by position, so test the note's bit rather than scanning self.notes:
+                return bool((self._position_mask >> item.position) & 1)
+            else:
+                # (Note subclasses keep their own equality rules)
+                return item in self.notes
         elif isinstance(item, (Chord, str)):
             # accept objects that cast to Chords:
             if isinstance(item, str):
                 item = Chord(item)
             assert isinstance(item, Chord)
 
-            # chord is 'in' this Key if all ofits notes are:
-            if item.root not in self.notes:
-                return False # easy early pruning
-            else:
-                for note in item.notes:
-                    if note not in self.notes:
-                        return False
-            return True
+            # chord is 'in' this Key if all of its notes are,
+            # i.e. if its note positions are a subset of ours:
+            return (item._position_mask & ~self._position_mask) == 0
 
         else:
             raise TypeError(f'Key.__contains__ not defined for items of type: {type(item)}')
 
+    @property
+    def _position_mask(self):
+        """12-bit integer with one bit set for the position of each note in this key
+        (built on first access and cached thereafter, as for Chord._position_mask)"""
+        try:
+            return self._position_mask_cache
+        except AttributeError:
+            mask = 0
+            for n in self.notes:
+                mask |= 1 << n.position
+            self._position_mask_cache = mask
+            return mask
+
     def __eq__(self, other):
         if isinstance(other, Key):
             return self.notes == other.notes
@@ -536,21 +561,25 @@ def matching_keys(chords=None, notes=None, exclude=None, require_tonic=True, req
         # search all known scales and modes
         shortlist_interval_scale_names = interval_mode_names
 
+    # excluded notes and required chord roots as 12-bit note-position masks,
+    # so that each candidate can be checked against them in a single bitwise operation:
+    exclude_mask = 0
+    for exc in exclude:
+        exclude_mask |= 1 << exc.position
+    roots_mask = 0
+    if require_roots and (chords is not None):
+        for c in chords:
+            roots_mask |= 1 << c.root.position
+
     for t in candidate_tonics:
         for intervals, mode_names in shortlist_interval_scale_names.items():
-            candidate_notes = [t] + [t + i for i in intervals]
-
-            does_not_contain_exclusions = True
-            for exc in exclude:
-                if exc in candidate_notes:
-                    does_not_contain_exclusions = False
-                    break
-            if require_roots and (chords is not None):
-                for c in chords:
-                    if c.root not in candidate_notes:
-                        does_not_contain_exclusions = False
-                        break
+            candidate_mask = 1 << t.position
+            for i in intervals:
+                candidate_mask |= 1 << ((t.position + i.value) % 12)
+
+            does_not_contain_exclusions = (candidate_mask & exclude_mask) == 0 and (roots_mask & ~candidate_mask) == 0
             if does_not_contain_exclusions:
+                candidate_notes = [t] + [t + i for i in intervals]
                 # initialise candidate object:
                 # (this can be removed for a fast method; it's mostly for upweighting key fifths)
 
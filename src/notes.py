@@ -8,6 +8,7 @@ from . import conversion as conv
 from .util import log, rotate_list
 
 import math
+from types import MappingProxyType
 
 ### TBI: enharmonic equivalence operator? &? ^?
 
@@ -31,11 +32,17 @@ def preferred_name(pos, prefer_sharps=False):
     name = parsing.preferred_note_names['b'][pos] if not prefer_sharps else parsing.preferred_note_names['#'][pos]
     return name
 
+# notes hash by position, as hash(f'Note:{position}'), which we precompute
+# for each of the twelve positions rather than formatting a string on every call:
+note_position_hashes = [hash(f'Note:{pos}') for pos in range(12)]
+
 
 class Note:
     """a note/chroma/pitch-class defined in the abstract,
     i.e. not associated with a specific note inside an octave,
     such as: C or D#"""
+    __slots__ = ('name', 'position', 'prefer_sharps', 'chroma', 'natural', 'sharp_name', 'flat_name')
+
     def __init__(self, name=None, position=None, prefer_sharps=None, case_sensitive=True, strip_octave=False):
 
         if isinstance(name, Note):
@@ -130,7 +137,7 @@ class Note:
             # note transposition by interval
             # interval = other.value  # cast to int
             new_pos = (self.position + int(other)) % 12
-            new_note = Note(position = new_pos, prefer_sharps = self.prefer_sharps) # inherit sharpness from self
+            new_note = note_at(new_pos, self.prefer_sharps) # inherit sharpness from self
             # log(f'Adding interval ({interval}) to self ({self}) to produce Note: {chrm}')
             return new_note
         elif isinstance(other, (str, Note)):
@@ -188,7 +195,7 @@ class Note:
 
     def __hash__(self):
         """note and octavenote hash-equivalence is based on position alone, not value"""
-        return hash(f'Note:{self.position}')
+        return note_position_hashes[self.position]
 
     @property
     def _marker(self):
@@ -258,6 +265,7 @@ class OctaveNote(Note):
     except it also has .octave, .value, .pitch attrs defined on top,
     and its addition/subtraction operators respect octave/value as well as position.
     """
+    __slots__ = ('octave', 'value', 'pitch')
 
     def __init__(self, name=None, value=None, pitch=None, prefer_sharps=None):
         """initialises an OctaveNote object from one of the following:
@@ -383,7 +391,7 @@ class OctaveNote(Note):
 
     def __hash__(self):
         """note and octavenote hash-equivalence is based on position alone, not value"""
-        return hash(f'Note:{self.position}')
+        return note_position_hashes[self.position]
 
     @property
     def _marker(self):
@@ -553,11 +561,11 @@ class NoteList(list):
             strip_octave = self.strip_octave
         if isinstance(note_obj, OctaveNote):
             if strip_octave:
-                return Note(note_obj.position)
+                return note_at(note_obj.position)
             else:
                 return OctaveNote(note_obj.name)
         elif isinstance(note_obj, Note):
-            return Note(note_obj.position)
+            return note_at(note_obj.position)
         else:
             raise TypeError(f'Cannot recast non-Note object: {type(note_obj)}')
 
@@ -657,6 +665,16 @@ class NoteList(list):
 
     def ascending_intervals(self):
         """sorts notes into ascending order from first note (as root)"""
+        if not any(isinstance(n, OctaveNote) for n in self):
+            # for abstract notes, each note is simply the next one of its chroma above the last,
+            # so we can step through their positions directly without placing OctaveNotes:
+            values = [0]
+            prev_position = self[0].position
+            for n in self[1:]:
+                values.append(values[-1] + (((n.position - prev_position) % 12) or 12))
+                prev_position = n.position
+            return IntervalList(values)
+
         # wrap around first octave and calculate intervals from root:
         octaved_notes = self.force_octave(1)
         root = octaved_notes[0]
@@ -766,6 +784,21 @@ class NoteList(list):
 # quality-of-life alias:
 Notes = NoteList
 
+# whether each position is a white note, for the fast Note constructor below:
+_natural_positions = tuple([parsing.preferred_note_names['b'][pos] in parsing.natural_note_names for pos in range(12)])
+
+def note_at(position, prefer_sharps=False):
+    """returns a new Note, the same as Note(position=position, prefer_sharps=prefer_sharps),
+    but skipping Note.__init__'s argument parsing, for internal callers that already have
+    a pitch class int from 0 to 11 (such as notes shifted by intervals, or recast into NoteLists)"""
+    note = object.__new__(Note)
+    note.position, note.prefer_sharps = position, prefer_sharps
+    note.sharp_name = parsing.preferred_note_names['#'][position]
+    note.flat_name = parsing.preferred_note_names['b'][position]
+    note.name = note.chroma = note.sharp_name if prefer_sharps else note.flat_name
+    note.natural = _natural_positions[position]
+    return note
+
 # predefined Note objects:
 A = Note('A')
 Bb = Note('Bb')
@@ -783,12 +816,19 @@ Ab = Note('Ab')
 # all chromatic pitch classes:
 chromatic_scale = [C, Db, D, Eb, E, F, Gb, G, Ab, A, Bb, B]
 
-# relative minors/majors of all chromatic notes:
-relative_minors = {c.name : (c - 3).name for c in chromatic_scale}
-relative_minors.update({c.sharp_name: (c-3).sharp_name for c in chromatic_scale})
-relative_minors.update({c.flat_name: (c-3).flat_name for c in chromatic_scale})
+# relative minors/majors of all chromatic notes, keyed by note name.
+# built directly from pitch classes (the relative minor is 3 semitones down)
+# so that no Note objects need to be instantiated, and made read-only since they are shared.
+# (flat names are written last, so they take precedence for notes that have both)
+def _build_relative_minors():
+    rel_minors = {}
+    for preference in ('b', '#', 'b'):
+        names = parsing.preferred_note_names[preference]
+        rel_minors.update({names[pc]: names[(pc-3) % 12] for pc in range(12)})
+    return rel_minors
 
-relative_majors = {value:key for key,value in relative_minors.items()}
+relative_minors = MappingProxyType(_build_relative_minors())
+relative_majors = MappingProxyType({value:key for key,value in relative_minors.items()})
 
 # some chord/key tonics correspond to a preference for sharps or flats:
 sharp_tonic_names = ['G', 'D', 'A', 'E', 'B']
@@ -802,3 +842,9 @@ neutral_major_tonics = [Note(t) for t in neutral_tonic_names]
 sharp_minor_tonics = [Note(relative_minors[t]) for t in sharp_tonic_names]
 flat_minor_tonics = [Note(relative_minors[t]) for t in flat_tonic_names]
 neutral_minor_tonics = [Note(relative_minors[t]) for t in neutral_tonic_names]
+
+# frozensets of the positions of those tonics, for fast membership tests in sharp preference detection:
+sharp_major_tonic_positions = frozenset(n.position for n in sharp_major_tonics)
+flat_major_tonic_positions = frozenset(n.position for n in flat_major_tonics)
+sharp_minor_tonic_positions = frozenset(n.position for n in sharp_minor_tonics)
+flat_minor_tonic_positions = frozenset(n.position for n in flat_minor_tonics)
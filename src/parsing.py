@@ -1,5 +1,7 @@
 #### string parsing functions
+import re
 from collections import defaultdict
+from functools import lru_cache
 from .util import reverse_dict, unpack_and_reverse_dict, log
 
 ######################################## accidentals
@@ -12,6 +14,8 @@ offset_accidentals = {-2: ['𝄫', '♭♭', 'bb'],
                  2: ['𝄪', '♯♯', '##']}
 # map accidental aliases to offsets:
 accidental_offsets = unpack_and_reverse_dict(offset_accidentals)
+# and offsets to just their primary (unicode) accidental, as used for display:
+offset_accidental_chars = {offset: accs[0] for offset, accs in offset_accidentals.items()}
 
 def accidental_value(acc):
     return accidental_offsets[acc]
@@ -74,6 +78,16 @@ for c in accidental_offsets.keys():
 natural_note_positions = set(note_positions[n] for n in natural_note_names)
 valid_note_names = set(note_positions.keys())
 
+# precompiled pattern matching a note name at the start of a string:
+# a natural note letter, then optionally either a two-character accidental (like ## or bb)
+# or a single-character one (like # or ♭), tried in that order
+_single_accidentals = [a for a in accidental_offsets.keys() if len(a) == 1]
+_double_accidentals = [a for a in accidental_offsets.keys() if len(a) == 2]
+_note_name_prefix = re.compile('[{}](?:{}|[{}])?'.format(
+                                    ''.join(natural_note_names),
+                                    '|'.join(re.escape(a) for a in _double_accidentals),
+                                    ''.join(re.escape(a) for a in _single_accidentals)))
+
 # now the preferred name of each note by preference:
 preferred_note_names = {}
 for preference in 'b', '#':
@@ -186,19 +200,14 @@ def is_valid_note_name(name: str, case_sensitive=True):
     # else:
     #     return False
 
+@lru_cache(maxsize=2048) # (called on every chord name string that gets parsed, which are very repetitive)
 def begins_with_valid_note_name(name: str):
     """checks if a string contains a valid note name in its first two characters.
-    returns 2 for a two-character note name, 1 for a one-character name, and False if neither."""
-    if len(name) >= 3 and is_valid_note_name(name[:2], case_sensitive=True) and is_accidental(name[1:3]):
-        # three-character note (e.g. E## or Gbb)
-        return 3
-    if len(name) >= 2 and is_valid_note_name(name[:2]):
-        # two-character note
-        return 2
-    elif is_valid_note_name(name[0]):
-        return 1
-    else:
-        return False
+    returns 3 for a three-character note name (e.g. E## or Gbb), 2 for a two-character note name,
+    1 for a one-character name, and False if neither."""
+    # (a single regex match, rather than slicing and checking each possible length in turn)
+    match = _note_name_prefix.match(name)
+    return match.end() if match is not None else False
 
 def parse_out_note_names(note_string, graceful_fail=False):
     """for some string of valid note letters, of undetermined length,
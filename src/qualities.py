@@ -1,6 +1,7 @@
 # OOP representation of major/minor quality that is invertible and has a null (indeterminate) value
 from .util import reverse_dict, unpack_and_reverse_dict, reduce_aliases, log
 from .parsing import degree_names, is_valid_note_name, parse_alteration, accidental_offsets, offset_accidentals
+from functools import lru_cache
 
 
 # TBI: double dim/aug qualities?
@@ -258,11 +259,12 @@ class ChordQualifier:
         # sort the summary attribute:
         self.summary = {k : self.summary[k] for k in sorted(self.summary.keys())}
 
-    def apply(self, factors):
-        """modify a ChordFactors object with the alterations specified in this Qualifier and return the result"""
+    def apply(self, factors, inplace=False):
+        """modify a ChordFactors object with the alterations specified in this Qualifier and return the result.
+        if inplace, the input object itself is modified (and returned) instead of a copy of it"""
         assert isinstance(factors, dict), f"ChordQualifiers can only be applied to ChordFactors or  dicts, but was attempted on: {type(factors)}"
         # in order: remove, add, modify
-        new_factors = factors.copy()
+        new_factors = factors if inplace else factors.copy()
 
         # verify that certain degrees are present, absent or modified:
         for d, v in self.verifications.items():
@@ -328,14 +330,31 @@ class ChordQualifier:
 
     def valid_on(self, other):
         """returns True if this is a valid qualifier to apply to a given ChordFactors object, and false otherwise"""
-        # from chords import ChordFactors # lazy import to avoid circular dependencies
-        # proxy = ChordFactors(other)
-        try:
-            _ = self.apply(other)
-        except:
+        # checks the same conditions that self.apply asserts, but directly, without copying
+        # the factors or raising (and formatting the message of) an exception when invalid:
+        if not isinstance(other, dict):
             return False
-        else:
-            return True
+        for d, v in self.verifications.items():
+            if v is False:
+                if d in other:
+                    return False
+            elif v is True:
+                if d not in other:
+                    return False
+            elif isinstance(v, int):
+                if d not in other or other[d] != v:
+                    return False
+        for d in self.removals:
+            if d not in other:
+                return False
+        for d in self.additions:
+            if d in other:
+                return False
+        for d in self.modifications:
+            # (a degree that gets removed can only be modified if it is made again first)
+            if d not in other or (d in self.removals and d not in self.makes):
+                return False
+        return True
 
     def describe(self):
         """Describes this ChordQualifier object in natural language"""
@@ -533,7 +552,19 @@ alias_qualifiers = unpack_and_reverse_dict(qualifier_aliases)
 def parse_chord_qualifiers(qual_str, verbose=False, allow_note_names=False):
     """given a string of qualifiers that typically follows a chord root,
     e.g. 7sus4add11♯5,
-    recursively parse them into a list of ChordQualifier objects"""
+    recursively parse them into a list of ChordQualifier objects.
+    the same short strings get parsed over and over, so results are memoised by string
+    (the list is new each time, but the ChordQualifier objects inside it are shared)"""
+    if verbose:
+        return _parse_chord_qualifiers(qual_str, verbose=True, allow_note_names=allow_note_names)
+    return list(_cached_chord_qualifiers(qual_str, allow_note_names))
+
+@lru_cache(maxsize=512)
+def _cached_chord_qualifiers(qual_str, allow_note_names):
+    return tuple(_parse_chord_qualifiers(qual_str, allow_note_names=allow_note_names))
+
+def _parse_chord_qualifiers(qual_str, verbose=False, allow_note_names=False):
+    """does the actual work of parse_chord_qualifiers, without memoisation"""
 
     reduced_quals = reduce_aliases(qual_str, qualifier_aliases, reverse=True, include_keys=True)
     if not allow_note_names:
@@ -6,6 +6,8 @@ from .qualities import ChordQualifier, Quality
 from .parsing import num_suffixes, numerals_roman
 from . import notes as notes
 
+from functools import lru_cache
+
 
 # standard keys are: natural/melodic/harmonic majors and minors
 
@@ -52,6 +54,13 @@ mode_idx_names = {
 ################################################################################
 ### Scale, Subscale, and ScaleDegree classes
 
+@lru_cache(maxsize=1024)
+def _degree_interval(value, degree):
+    """returns the Interval with this value and degree. every Scale init builds one of these
+    for each of its degrees, from the same few dozen (value, degree) pairs, and since Intervals
+    are immutable the same objects can be shared between all scales"""
+    return Interval(value, degree=degree)
+
 
 
 ### TBI: should scales be able to be modified by ChordQualifiers or something similar, like ChordFactors can?
@@ -64,10 +73,10 @@ class Scale:
         self.intervals, self.base_scale_name, self.rotation = self._parse_input(scale_name, intervals, mode, stacked)
 
         # build degrees dict that maps ScaleDegrees to this scale's intervals:
-        self.degree_intervals = {1: Interval(0)}
+        self.degree_intervals = {1: _degree_interval(0, 1)}
         for d, i in enumerate(self.intervals):
             deg = d+2 # starting from 2
-            self.degree_intervals[deg] = Interval(value=i.value, degree=deg)
+            self.degree_intervals[deg] = _degree_interval(i.value, deg)
         self.interval_degrees = reverse_dict(self.degree_intervals)
 
         # base degrees and degrees are identical for Scale objects, but may differ for Subscales:
@@ -175,7 +184,7 @@ class Scale:
         desired_degrees = range(2,8)
         sanitised_intervals = IntervalList()
         for d, i in zip(desired_degrees, intervals):
-            sanitised_intervals.append(Interval(i.value, degree=d))
+            sanitised_intervals.append(_degree_interval(i.value, d))
         return sanitised_intervals
 
     def _add_chromatic_intervals(self, chromatic_intervals):
@@ -699,6 +708,12 @@ class Scale:
     @property
     def consonance(self, tonic_weight=2):
         """simply the mean of pairwise interval consonances"""
+        # this depends only on the scale's interval values, which every Key with this scale shares
+        # (whatever its tonic), so we memoise it by those rather than computing it for every Key:
+        structure = self._consonance_structure()
+        if structure in _scale_consonances:
+            return _scale_consonances[structure]
+
         cons_list = list(self.get_pairwise_consonances(extra_tonic=True).values())
         raw_cons = sum(cons_list) / len(cons_list)
         # return raw_cons
@@ -710,8 +725,17 @@ class Scale:
         min_cons = 0.62 # 0.6731 0.6347743068389496
 
         rescaled_cons = (raw_cons - min_cons) / (max_cons - min_cons)
+        _scale_consonances[structure] = rescaled_cons
         return rescaled_cons
 
+    def _consonance_structure(self):
+        """the values that this scale's pairwise intervals (and therefore its consonance) are computed from,
+        as a hashable tuple"""
+        chromatic_values = None if self.chromatic_intervals is None else tuple([i.value for i in self.chromatic_intervals])
+        return (tuple([(d, i.value) for d, i in self.degree_intervals.items()]),
+                tuple([i.value for i in self.diatonic_intervals]),
+                chromatic_values, self.is_subscale)
+
     @property
     def rarity(self):
         scale_name = interval_mode_names[self.intervals][-1]
@@ -996,6 +1020,9 @@ def rotate_mode_intervals(scale_intervals_from_tonic, degree):
 
 # in this loop we build the mode_lookup dict that connects mode aliases to their corresponding identifiers as (base, degree) tuples
 # and also construct the interval_mode_names dict that connects IntervalLists to corresponding mode names
+# memoised Scale.consonance values, keyed by Scale._consonance_structure:
+_scale_consonances = {}
+
 mode_lookup = {}   # lookup of any possible name for a key/scale/mode, i.e. 'natural minor' or 'aeolian' or 'phrygian dominant', to tuples of (base_scale, degree)
 interval_mode_names = {}  # lookup of IntervalLists to the names that scale is known by
 non_scale_interval_mode_names = {} # a subset of interval_mode_names that does not include modes enharmonic to base scales
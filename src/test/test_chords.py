@@ -3,14 +3,23 @@ from .testing_tools import compare
 
 def unit_test():
 
+    # chords that are compared against more than once, initialised just once here:
+    Esm7_C, m7_2 = Chord('E#m7/C'), AbstractChord('m7/2')
+    Am_C, Am, C6no5 = Chord('Am/C'), Chord('Am'), Chord('C6(no5)')
+
     # test inversion by factor/bass, AbstractChord->Chord initialisation, and unusual note names:
-    compare(Chord('E#m7/C'), AbstractChord('m7/2').on_root('F'))
-    compare(Chord('E#m7/C'), AbstractChord('m7/2').on_bass('C'))
+    compare(Esm7_C, m7_2.on_root('F'))
+    compare(Esm7_C, m7_2.on_bass('C'))
     # test correct production of root notes/intervals and inverted notes/intervals:
-    compare(Chord('Am/C').root_notes, Chord('Am').root_notes)
-    compare(Chord('Am/C').root_intervals, Chord('Am').root_intervals)
-    compare(Chord('Am/C').notes, Chord('C6(no5)').notes)
-    compare(Chord('Am/C').intervals, Chord('C6(no5)').intervals)
+    compare(Am_C.root_notes, Am.root_notes)
+    compare(Am_C.root_intervals, Am.root_intervals)
+    compare(Am_C.notes, C6no5.notes)
+    compare(Am_C.intervals, C6no5.intervals)
+    # a bass note shared by two factors (the 2 and 9 of a 9sus2) inverts over the lower one:
+    compare(Chord('Fmaj9sus2').invert(bass='G').intervals, [0, 5, 9, 10, 12])
+    # and sharp/flat spellings of chord notes:
+    compare([n.name for n in Chord('Ebmaj7').sharp_notes], ['D#', 'G', 'A#', 'D'])
+    compare([n.name for n in Chord('D#maj7').flat_notes], ['Eb', 'G', 'Bb', 'D'])
 
     # test magic methods: transposition:
     compare(Chord('Caug7') + Interval(4), Chord('Eaug7'))
@@ -23,7 +32,7 @@ def unit_test():
     # test chord membership:
     compare(4 in AbstractChord('sus4'), True)
     compare(Interval(4) in AbstractChord('sus4'), False)
-    compare('C' in Chord('Am'), True)
+    compare('C' in Am, True)
 
     # test chord matching by notes:
     print(matching_chords('CEA'))
@@ -36,6 +45,17 @@ def unit_test():
 
     # test chord inversion identification from intervals:
     compare(AbstractChord(intervals=[0, 4, 9]), AbstractChord('m/1'))
+    # intervals with an octave on top are kept as given when they make a chord in root position,
+    # and rejected when the only matching inversions would have to drop the octave:
+    for octave_ivs in ([4, 7, 12], [Interval(4), Interval(7), Interval(12)]):
+        compare(AbstractChord(intervals=octave_ivs).intervals, [0, 4, 7, 12])
+    for octave_ivs in ([4, 8, 12], [Interval(4), Interval(8), Interval(12)], [5, 12], [Interval(5), Interval(12)]):
+        try:
+            AbstractChord(intervals=octave_ivs)
+            rejected = False
+        except AssertionError:
+            rejected = True
+        compare(rejected, True)
 
     # test recursive init for non-existent bass note inversions:
     compare(Chord('D/C#'), Chord('Dmaj7/C#'))
@@ -32,11 +32,20 @@ def unit_test():
     compare((Aug4 - Interval(12)).degree, (~Aug4).degree)
     compare(Interval(4) - Interval(24), Interval(-20))
 
+    print('Comparison with ints in either direction:')
+    compare((M3 <= 4, M3 > 4, 5 >= M3, 3 < M3), (True, False, True, True))
+
 
     print('IntervalLists:')
     compare(IntervalList([M3, P5]).pad(left=True, right=True), IntervalList([P1, M3, P5, P8]))
     compare(IntervalList([M3, P5]), IntervalList([P1, M3, P5, P8]).strip())
     compare(IntervalList([M2, M3, P5]), IntervalList([M3, P5, M9]).flatten())
+    # membership stays in sync with removals, including of repeated intervals:
+    ivs = IntervalList([P1, M3, P5, M3])
+    ivs.remove(M3)
+    compare(M3 in ivs, True)
+    compare(ivs.pop(), M3)
+    compare(M3 in ivs, False)
 
 
 
@@ -17,7 +17,8 @@ class TestSuite:
             result = (diff < 1e-10)
         else:
             if compare == 'equal':
-                result = (op == exp)
+                # (an object is equal to itself, so skip the structural comparison)
+                result = (op is exp) or (op == exp)
             elif compare == 'enharmonic':
                 result = (op & exp)
 
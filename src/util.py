@@ -216,19 +216,18 @@ def check_all(iterable, check, type_assertion):
         'isinstance' / 'instance': use "isinstance(X, Y)""
         '==' / 'eq' / 'equals':    use "type(X) == Y"
         'is':                      use "X is Y"                             """
-    for item in iterable:
-        if check in ('isinstance', 'instance'):
-            if not (isinstance(item, type_assertion)):
-                return False
-        elif check in ('==', 'eq', 'equals'):
-            if not (type(item) == type_assertion):
-                return False
-        elif check == 'is':
-            if not (item is type_assertion):
-                return False
-        else:
+    # resolve the check once, rather than for every item:
+    if check in ('isinstance', 'instance'):
+        return all(isinstance(item, type_assertion) for item in iterable)
+    elif check in ('==', 'eq', 'equals'):
+        return all(type(item) == type_assertion for item in iterable)
+    elif check == 'is':
+        return all(item is type_assertion for item in iterable)
+    else:
+        # (an invalid check arg only fails once there is an item to check, so an empty iterable passes)
+        for item in iterable:
             raise Exception(f"invalid check arg ({check}) to assert_all, must be one of: 'isinstance', '==, 'is'")
-    return True
+        return True
 
 def transpose_nested_list(nested_list):
     """Given a list of lists (of equal length), or other iterables like strings,